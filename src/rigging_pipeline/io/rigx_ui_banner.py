@@ -1,6 +1,39 @@
 import os
+from functools import lru_cache
 from PySide2 import QtWidgets, QtCore, QtGui
 
+# Folders searched for banner icons, in order; resolved once at import
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+ICON_SEARCH_DIRS = (
+    # RigX project icons folder (config/icons at repo root)
+    os.path.join(REPO_ROOT, "config", "icons"),
+    # RigX project icons folder (from io folder: io -> rigging_pipeline -> icons)
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "icons"),
+    # RigX tools icons folder (from io folder: io -> rigging_pipeline -> tools -> icons)
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools", "icons"),
+    # Maya preferences icons folders (common versions)
+    os.path.join(os.path.expanduser("~"), "Documents", "maya", "2024", "prefs", "icons"),
+    os.path.join(os.path.expanduser("~"), "Documents", "maya", "2023", "prefs", "icons"),
+    os.path.join(os.path.expanduser("~"), "Documents", "maya", "2022", "prefs", "icons"),
+)
+
+
+@lru_cache(maxsize=None)
+def find_icon_path(icon_filename):
+    """Return the first existing path for an icon in ICON_SEARCH_DIRS, or None; looked up once per session"""
+    for icon_dir in ICON_SEARCH_DIRS:
+        icon_path = os.path.join(icon_dir, icon_filename)
+        if os.path.exists(icon_path):
+            return icon_path
+    return None
+
+
+@lru_cache(maxsize=16)
+def load_scaled_pixmap(path, width, height):
+    """Load an image scaled to fit width x height; read and resampled once per session"""
+    return QtGui.QPixmap(path).scaled(width, height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+
 class Banner(QtWidgets.QFrame):
 
     def __init__(self, title, icon_filename=None, parent=None):
@@ -33,36 +66,17 @@ class Banner(QtWidgets.QFrame):
         banner_layout.setSpacing(10)
 
         if icon_filename:
-            # Try multiple icon paths
-            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
-            icon_paths = [
-                # RigX project icons folder (config/icons at repo root)
-                os.path.join(repo_root, "config", "icons", icon_filename),
-                # RigX project icons folder (from io folder: io -> rigging_pipeline -> icons)
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), "icons", icon_filename),
-                # RigX tools icons folder (from io folder: io -> rigging_pipeline -> tools -> icons)
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools", "icons", icon_filename),
-                # Maya preferences icons folders (common versions)
-                os.path.join(os.path.expanduser("~"), "Documents", "maya", "2024", "prefs", "icons", icon_filename),
-                os.path.join(os.path.expanduser("~"), "Documents", "maya", "2023", "prefs", "icons", icon_filename),
-                os.path.join(os.path.expanduser("~"), "Documents", "maya", "2022", "prefs", "icons", icon_filename),
-            ]
-            
-            icon_found = False
-            for icon_path in icon_paths:
-                if os.path.exists(icon_path):
-                    icon_label = QtWidgets.QLabel()
-                    icon_label.setObjectName("icon")
-                    icon_pixmap = QtGui.QPixmap(icon_path).scaled(40, 40, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                    icon_label.setPixmap(icon_pixmap)
-                    banner_layout.addWidget(icon_label)
-                    icon_found = True
-                    break
-            
-            if not icon_found:
+            icon_path = find_icon_path(icon_filename)
+            if icon_path:
+                icon_label = QtWidgets.QLabel()
+                icon_label.setObjectName("icon")
+                icon_pixmap = load_scaled_pixmap(icon_path, 40, 40)
+                icon_label.setPixmap(icon_pixmap)
+                banner_layout.addWidget(icon_label)
+            else:
                 print(f"Warning: Icon '{icon_filename}' not found in any of these paths:")
-                for path in icon_paths:
-                    print(f"  - {path}")
+                for icon_dir in ICON_SEARCH_DIRS:
+                    print(f"  - {os.path.join(icon_dir, icon_filename)}")
                 banner_layout.addSpacing(15)
         else:
             banner_layout.addSpacing(15)
@@ -1,6 +1,7 @@
 import maya.cmds as cmds
 import maya.api.OpenMaya as om
 from collections import defaultdict
+from operator import attrgetter
 import re
 import json
 import os
@@ -12,6 +13,22 @@ from maya import OpenMayaUI as omui
 
 from rigging_pipeline.tools.ui.rigx_riggingValidator_ui import RiggingValidatorUI
 
+# Order in which validations are listed and run, by name without the 'dp' prefix;
+# modules not named here go last
+PRIORITY_ORDER = (
+    # Priority validations (in order)
+    "AssetChecker",
+    "ReferencedFileChecker", "NamespaceCleaner", "DupicatedName",
+    "KeyframeCleaner", "UnknownNodesCleaner", "UnusedNodeCleaner",
+    "NgSkinToolsCleaner",
+    # Rest all (in alphabetical order for consistency)
+    "BindPoseCleaner", "CharacterSet", "ColorSetCleaner", "ControllerTag",
+    "DisplayLayers", "FreezeTransform", "GeometryHistory", "HideAllJoints",
+    "JointEndCleaner", "OutlinerCleaner", "PruneSkinWeights",
+    "TweakNodeCleaner", "UnusedSkinCleaner",
+)
+PRIORITY_RANK = {name: index for index, name in enumerate(PRIORITY_ORDER)}
+
 
 def maya_main_window():
     ptr = omui.MQtUtil.mainWindow()
@@ -23,6 +40,8 @@ class ValidationModule:
     
     def __init__(self, name, file_path, category):
         self.name = name
+        # Display name without the 'dp' prefix, computed once at registration
+        self.clean_name = name[2:] if name.startswith('dp') else name
         self.file_path = file_path
         self.category = category
         self.enabled = True
@@ -575,35 +594,19 @@ class RiggingValidator:
         """Get modules organized by category"""
         categories = defaultdict(list)
         
-        # Define the priority order
-        rig_order = [
-            # Priority validations (in order)
-            "AssetChecker",
-            "ReferencedFileChecker", "NamespaceCleaner", "DupicatedName",
-            "KeyframeCleaner", "UnknownNodesCleaner", "UnusedNodeCleaner", 
-            "NgSkinToolsCleaner",
-            # Rest all (in alphabetical order for consistency)
-            "BindPoseCleaner", "CharacterSet", "DisplayLayers", "HideAllJoints", 
-            "OutlinerCleaner", "PruneSkinWeights", "UnusedSkinCleaner"
-        ]
-        
         # Sort modules by priority order
         for module_name, module in self.modules.items():
+            module.priority = PRIORITY_RANK.get(module.clean_name, 999)
             # All modules go to rigging category
             if module.enabled:
-                # Find priority index
-                try:
-                    priority_index = rig_order.index(module_name.replace('dp', ''))
-                except ValueError:
-                    priority_index = 999
-                module.priority = priority_index
                 categories['rigging'].append(module)
             else:
                 categories['disabled'].append(module)
         
         # Sort each category by priority
+        by_priority = attrgetter('priority')
         for category_name in categories:
-            categories[category_name].sort(key=lambda x: getattr(x, 'priority', 999))
+            categories[category_name].sort(key=by_priority)
         
         return dict(categories)
     
@@ -676,30 +679,24 @@ class RiggingValidator:
                                 actual_issues.append(issue)
                             else:
                                 # This is a "clean" message, treat as success
-                                clean_name = module.name.replace('dp', '')
-                                self.results['info'].append(f"{clean_name}: {issue['message']} - {issue['object']}")
+                                self.results['info'].append(f"{module.clean_name}: {issue['message']} - {issue['object']}")
                         
                         # Only show dialog if there are actual issues
                         if actual_issues:
                             for issue in actual_issues:
-                                clean_name = module.name.replace('dp', '')
-                                self.results['warnings'].append(f"{clean_name}: {issue['message']} - {issue['object']}")
+                                self.results['warnings'].append(f"{module.clean_name}: {issue['message']} - {issue['object']}")
                             total_issues += len(actual_issues)
                         else:
                             # All issues were "clean" messages, treat as success
-                            clean_name = module.name.replace('dp', '')
-                            self.results['info'].append(f"{clean_name}: All validations passed")
+                            self.results['info'].append(f"{module.clean_name}: All validations passed")
                     else:
-                        clean_name = module.name.replace('dp', '')
-                        self.results['info'].append(f"{clean_name}: No issues found")
+                        self.results['info'].append(f"{module.clean_name}: No issues found")
                 else:
-                    clean_name = module.name.replace('dp', '')
-                    self.results['errors'].append(f"{clean_name}: {result['message']}")
+                    self.results['errors'].append(f"{module.clean_name}: {result['message']}")
             except Exception as e:
                 error_result = {"status": "error", "message": f"Error - {str(e)}", "total_issues": 1}
                 module_results[module.name] = error_result
-                clean_name = module.name.replace('dp', '')
-                self.results['errors'].append(f"{clean_name}: Error - {str(e)}")
+                self.results['errors'].append(f"{module.clean_name}: Error - {str(e)}")
         
         # Return both module results and consolidated results
         return module_results
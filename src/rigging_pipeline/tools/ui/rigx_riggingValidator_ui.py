@@ -1,3 +1,7 @@
+from contextlib import contextmanager
+from functools import partial
+import re
+
 import maya.cmds as cmds
 from PySide2 import QtWidgets, QtCore, QtGui
 from shiboken2 import wrapInstance
@@ -5,6 +9,352 @@ from maya import OpenMayaUI as omui
 
 from rigging_pipeline.io.rigx_theme import THEME_STYLESHEET
 from rigging_pipeline.io.rigx_ui_banner import Banner
+from rigging_pipeline.utils.rig.utils_rig import suspend_viewport_refresh
+
+# Tooltip descriptions for each validation module, keyed by name without the 'dp' prefix
+VALIDATION_DESCRIPTIONS = {
+    # All validations (formerly Model + Rig) - Geometry, mesh, rigging and animation related
+    "ImportReference": "It will check if there are referenced file to import them up.",
+    "NamespaceCleaner": "Check if there are namespaces to clean them up. It won't delete namespace from rigXGuides.",
+    "DupicatedName": "Check if there are nodes with duplicate short names and report them.",
+    "UnlockInitialShadingGroup": "It will unlock the InitialShadingGroup to avoid the blocking to just create a simple polyCube.",
+    "ShowBPCleaner": "It will delete the ShowBP scriptNodes.",
+    
+    "ParentedGeometry": "It will verify if there are some parented geometries in the hierarchy.",
+    "OneVertex": "It will verify if there are some non manifold vertex in the meshes. That means a vertex in the union of 2 shapes.",
+    "TFaceCleaner": "It will verify if there are T faces in the meshes. That means if there's one edge connected to 3 or plus faces. It will fix them.",
+    "LaminaFaceCleaner": "It will verify if there are some lamina faces in the meshes and cleanup them.",
+    "NonManifoldCleaner": "It will verify if there are polygons with non-manifold issues and remove them.",
+    "NonQuadFace": "It will find non quad polygon faces. These cannot be fixed automatically and require manual attention.",
+    "BorderGap": "It will find borders or holes in the mesh. These cannot be fixed automatically, but you can try to use the fill hole Maya command to fix them.",
+    "RemainingVertexCleaner": "It will verify if there are some remaining vertex in the meshes. It means have one vertex connected to only 2 non border edges.",
+    "UnlockNormals": "It will unlock normals from the geometries.",
+    "InvertedNormals": "It will verify inverted normals in the geometries.",
+    "SoftenEdges": "It will verify soften edges in the geometries.",
+    "OverrideCleaner": "It will verify if there are nodes with overrides and remove them.",
+    
+    # Additional validations (CheckOut) - Rigging and animation related
+    "CycleChecker": "It will verify if there are cycle errors in the scene. It will only verify and report them as this theme is very complex to fix automatically.",
+    "KeyframeCleaner": "It will delete the animated objects keyframes. It won't check drivenKeys, blendWeights or pairBlends.",
+    "NgSkinToolsCleaner": "It will clean-up all ngSkinTools custom nodes forever.",
+    "BrokenNetCleaner": "It will detect if there are some broken correction manager network to clean-up them.",
+    "HideDataGrp": "It will hide the Data_Grp if it isn't hidden yet.",
+    "SideCalibration": "It will detect if there are some controllers with different side calibration and priorize the setup from the non defaultValue or use the left side as source if the two sides are configured.",
+    "TargetCleaner": "Check if there are blendShape primary targets to clean them up. It will delete not connected or not deformed geometries.",
+    "UnknownNodesCleaner": "It will clean-up the unknown nodes in the scene.",
+    "UnusedNodeCleaner": "It will remove unnecessary rendering nodes and unused animation curves.",
+    "PruneSkinWeights": "It will verify if there are small skinning weights to prune.",
+    "UnusedSkinCleaner": "It will remove unused skin influences.",
+    "EnvelopeChecker": "It will check for envelope attributes lower than one.",
+    "ScalableDeformerChecker": "It will verify if there are deformers with scalable connections in the scene. It will check and fix the scalable connections to deformers: skinCluster and deltaMush.",
+    "WIPCleaner": "Check if there are any node inside of the WIP_Grp and delete them.",
+    "ExitEditMode": "It will check if there are any corrective controller in the edit mode and it will back to normal state without save changes or settings.",
+    "HideCorrectives": "It will lock and hide the corrective attribute on Option_Ctrl",
+    "ControlsHierarchy": "Check if controls hierarchy match with a previous state exported, to prevent animation loss.",
+    "DisplayLayers": "It will check that no display layers exist in the scene (except the default layer). If any display layers are found, it will report them and clear them to keep the scene clean.",
+    "ResetPose": "It will reset the rig to its default pose.",
+    "BindPoseCleaner": "It will verify if there are bindPose nodes in the scene. If so, it will delete them and create just a new one node for all skinned joints.",
+    "RemapValueToSetRange": "It will verify if there are remapValue nodes that could be converted to setRange nodes without losing any behavior. It will optimize the calculation and get a faster rig.",
+    "HideAllJoints": "It will hide joints in the scene.",
+    "PassthroughAttributes": "It will verify if there are attributes with no necessary inbetween connections. If so, it will change (a -> b -> c) to (a -> c).",
+    "ProxyCreator": "Creates proxy geometry for performance optimization during rigging.",
+    "Cleanup": "It will check for rigXDeleteIt attributes and delete their nodes.",
+    "CharacterSet": "Validates and manages character sets for proper rigging workflow. Ensures character sets have proper naming, controls, and joint hierarchies.",
+    "ControlValues": "Check animation set controls for proper TR values (0) and Scale values (1). Ensures all controls are in their default state.",
+    "AssetChecker": "Asset Checker: derive asset from JOB_PATH, verify/rename top node to match.",
+}
+
+# Validation modules hidden from the list, by exact name or by case-insensitive name fragment
+EXCLUDED_MODULES = frozenset({
+    'dpColorSetCleaner',
+    'dpColorPerVertexCleaner',
+    'dpControllerTag',
+    'dpFreezeTransform',
+    'dpGeometryHistory',
+    'dpJointEndCleaner',
+    'dpTweakNodeCleaner',
+})
+EXCLUDED_PATTERN_RE = re.compile(r'colorset|colorpervertex|controller|freeze|geometry', re.IGNORECASE)
+
+# Result messages that describe a clean state rather than an issue (matched case-insensitively)
+CLEAN_PHRASES = (
+    "no issues found",
+    "nothing to clean",
+    "no problems detected",
+    "clean - no issues",
+    "passed - no issues",
+    "no duplicate names found",
+    "no custom namespaces found",
+    "no namespaces to clean",
+    "no bind pose nodes found",
+    "no display layers found",
+    "no display layers to clear",
+    "no joints found to check",
+    "no animation curves found",
+    "no ngskintools nodes found",
+    "outliner organized: 0 nodes moved",
+    "outliner is already well organized",
+    "outliner already clean",
+    "outliner is clean: only",
+    "all character sets are properly configured",
+    "no character sets found in scene",
+    "no skin clusters found to check",
+    "no references found in scene",
+    "no tweak nodes found to check",
+    "no unknown nodes found to check",
+    "not enough materials to check",
+    "fixed: 0 nodes = 0 materials",
+    "no low weights found",
+    "no unused materials found",
+    "has no unused influence joints",
+    "no action needed",
+    "already clean",
+    "already well organized",
+    "no action required",
+    "nothing to fix",
+    "no fixes needed",
+    "no cleanup needed",
+    "no cleanup required",
+    "no changes needed",
+    "no changes required",
+    "all validations passed",
+    "validation passed",
+    "passed successfully",
+    "successfully passed",
+    "no errors found",
+    "no warnings found",
+    "no problems found",
+    "no issues detected",
+    "no errors detected",
+    "no warnings detected",
+)
+CLEAN_PHRASE_RE = re.compile("|".join(re.escape(phrase) for phrase in CLEAN_PHRASES), re.IGNORECASE)
+
+# Message a validation module reports when it found nothing to fix
+ALL_PASSED = "All validations passed"
+
+# Emoji prefix for each kind of line in the results area
+RESULT_PREFIXES = {
+    "error": "❌ ",
+    "warning": "⚠️ ",
+    "pass": "✅ ",
+    "info": "ℹ️ ",
+}
+
+# Phrases that mark a fix-mode message as a successful fix (matched case-insensitively)
+FIX_PHRASES = ("created", "fixed", "removed", "cleaned", "parented", "imported")
+FIX_WARNING_PHRASES = FIX_PHRASES + ("structure has been fixed", "is now valid")
+FIX_PHRASE_RE = re.compile("|".join(re.escape(phrase) for phrase in FIX_PHRASES), re.IGNORECASE)
+FIX_WARNING_PHRASE_RE = re.compile("|".join(re.escape(phrase) for phrase in FIX_WARNING_PHRASES), re.IGNORECASE)
+
+# Stylesheet for the named window controls; merged into the window sheet in __init__
+CONTROLS_STYLESHEET = """
+    QSplitter#mainSplitter::handle {
+        background-color: #2A2A2A ;
+        height: 3px;
+    }
+    QSplitter#mainSplitter::handle:hover {
+        background-color: #666666;
+    }
+    QCheckBox#checkAll {
+        color: white;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QCheckBox#checkAll::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox#checkAll::indicator:unchecked {
+        border: 2px solid #2A2A2A ;
+        background-color: #2b2b2b;
+        border-radius: 4px;
+    }
+    QCheckBox#checkAll::indicator:checked {
+        border: 2px solid #4CAF50;
+        background-color: #4CAF50;
+        border-radius: 4px;
+    }
+    QCheckBox#checkAll::indicator:hover {
+        border: 2px solid #666666;
+    }
+    QScrollArea#validationsScroll {
+        border: none;
+        background-color: transparent;
+    }
+    QPushButton#btnValidate { 
+        background-color: #404040; 
+        color: #e0e0e0; 
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#btnValidate:hover {
+        background-color: #505050;
+    }
+    QPushButton#btnValidate:pressed {
+        background-color: #2A2A2A ;
+    }
+    QPushButton#btnFix { 
+        background-color: #4CAF50; 
+        color: #e0e0e0; 
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#btnFix:hover {
+        background-color: #66bb6a;
+    }
+    QPushButton#btnFix:pressed {
+        background-color: #388e3c;
+    }
+    QPushButton#btnFix:disabled {
+        background-color: #2A2A2A ;
+        color: #a0a0a0;
+        border: 1px solid #404040;
+    }
+    QPushButton#btnClear { 
+        background-color: #404040; 
+        color: #e0e0e0; 
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#btnClear:hover {
+        background-color: #505050;
+    }
+    QPushButton#btnInteractive { 
+        background-color: #4CAF50; 
+        color: #e0e0e0; 
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#btnInteractive:hover {
+        background-color: #60AF69;
+    }
+    QPushButton#btnInteractive:pressed {
+        background-color: #1976d2;
+    }
+    QLabel#resultsLabel {
+        color: #e0e0e0;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QPlainTextEdit#resultsDisplay { 
+        background-color: #2A2A2A ; 
+        border: 1px solid #404040;
+        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+        font-size: 11px;
+        min-height: 150px;
+        color: #e0e0e0;
+    }
+"""
+
+# Shared stylesheet for the per-module rows (checkbox, Verify, Fix, status)
+MODULE_ROW_STYLESHEET = """
+    QCheckBox#moduleCheckBox {
+        color: #e0e0e0;
+        font-size: 11px;
+        padding: 5px;
+        margin-right: 10px;
+        min-width: 150px;
+    }
+    QCheckBox#moduleCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+    }
+    QCheckBox#moduleCheckBox::indicator:unchecked {
+        border: 2px solid #404040;
+        background-color: #2A2A2A ;
+        border-radius: 3px;
+    }
+    QCheckBox#moduleCheckBox::indicator:checked {
+        border: 2px solid #4CAF50;
+        background-color: #4CAF50;
+        border-radius: 3px;
+    }
+    QPushButton#verifyBtn { 
+        background-color: #404040; 
+        color: #e0e0e0; 
+        border: none;
+        border-radius: 3px;
+        font-size: 10px;
+        font-weight: bold;
+    }
+    QPushButton#verifyBtn:hover {
+        background-color: #505050;
+    }
+    QPushButton#verifyBtn:pressed {
+        background-color: #2A2A2A ;
+    }
+    QPushButton#verifyBtn:disabled {
+        background-color: #2A2A2A ;
+        color: #a0a0a0;
+        border: 1px solid #404040;
+    }
+    QPushButton#fixBtn { 
+        background-color: #4CAF50; 
+        color: #e0e0e0; 
+        border: none;
+        border-radius: 3px;
+        font-size: 10px;
+        font-weight: bold;
+    }
+    QPushButton#fixBtn:hover {
+        background-color: #66bb6a;
+    }
+    QPushButton#fixBtn:pressed {
+        background-color: #388e3c;
+    }
+    QPushButton#fixBtn:disabled {
+        background-color: #2A2A2A ;
+        color: #a0a0a0;
+        border: 1px solid #404040;
+    }
+    QPushButton#statusBtn { 
+        background-color: #505050; 
+        color: #e0e0e0; 
+        border: none;
+        border-radius: 3px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QPushButton#statusBtn:disabled {
+        background-color: #505050;
+        color: #e0e0e0;
+    }
+    QPushButton#statusBtn[rigxStatus="pass"],
+    QPushButton#statusBtn[rigxStatus="pass"]:disabled {
+        background-color: #4CAF50;
+    }
+    QPushButton#statusBtn[rigxStatus="fail"],
+    QPushButton#statusBtn[rigxStatus="fail"]:disabled {
+        background-color: #f44336;
+    }
+    QPushButton#statusBtn[rigxStatus="warning"],
+    QPushButton#statusBtn[rigxStatus="warning"]:disabled {
+        background-color: #ff9800;
+    }
+"""
+
+# Glyph shown on the status button for each module status
+STATUS_GLYPHS = {
+    'pass': "✓",
+    'fail': "✗",
+    'warning': "?",
+    'default': "✓",
+}
 
 
 def maya_main_window():
@@ -22,7 +372,8 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         self.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.WindowMinimizeButtonHint | QtCore.Qt.WindowMaximizeButtonHint | QtCore.Qt.WindowCloseButtonHint)
         self.resize(500, 900)
         
-        # Set darker background similar to Skin Tool Kit
+        # Set darker background similar to Skin Tool Kit. Controls and module rows are
+        # styled by object name from this one sheet, so Qt resolves it in a single pass
         self.setStyleSheet("""
             QWidget {
                 background-color: #2D2D2D;
@@ -79,7 +430,7 @@ class RiggingValidatorUI(QtWidgets.QWidget):
             QPushButton:pressed {
                 background-color: #2A2A2A ;
             }
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #2A2A2A ;
                 border: 1px solid #404040;
                 color: #e0e0e0;
@@ -105,18 +456,53 @@ class RiggingValidatorUI(QtWidgets.QWidget):
             QSplitter::handle:hover {
                 background-color: #505050;
             }
-        """)
+        """ + CONTROLS_STYLESHEET + MODULE_ROW_STYLESHEET)
         
         self.validator = validator
+        
+        # The validator module imports this one at load time, so it is imported here
+        # rather than at the top; closeEvent uses these to unregister the window, and
+        # the module list and interactive run sort by its PRIORITY_RANK
+        from rigging_pipeline.tools import rigx_riggingValidator
+        self._validator_module = rigx_riggingValidator
+        self._open_windows = rigx_riggingValidator.UIManager._open_windows
         self._updating_check_all = False  # Flag to prevent circular dependency
         self._did_verify = False  # Track whether any verify has been run
+        self._rows_built = False  # Module rows are built lazily on first show
         
         # Initialize button dictionaries
+        self.module_checkboxes = {}
         self.module_verify_buttons = {}
         self.module_fix_buttons = {}
         self.module_status_buttons = {}  # Store status buttons for each module
         self.module_status_labels = {}  # Store status labels for each module
         self.module_verified = {}  # Track if a module has been verified at least once
+        self.module_status = {}  # Last status shown for each module
+        self._failed_count = 0  # Number of modules currently showing 'fail'
+        
+        # Result lines are collected here and written to the display in one go
+        self._pending_log = []
+        
+        # Modules still to check in an interactive run, and whether it was stopped
+        self._interactive_queue = []
+        self._interactive_cancelled = False
+        self._interactive_results = {}  # Up-front check results for the interactive run
+        self._interactive_scene_changed = False  # Set once the run has applied a fix
+        self._interactive_running = False
+        
+        # Single-shot timer so a burst of checkbox toggles refreshes Check All once
+        self._check_all_timer = QtCore.QTimer(self)
+        self._check_all_timer.setSingleShot(True)
+        self._check_all_timer.setInterval(0)
+        self._check_all_timer.timeout.connect(self._apply_check_all_state)
+        
+        # Single-shot timer so a burst of Verify/Fix/Validate clicks runs each distinct
+        # request once; pending requests are keyed by action (and module for Verify/Fix)
+        self._pending_actions = {}
+        self._action_timer = QtCore.QTimer(self)
+        self._action_timer.setSingleShot(True)
+        self._action_timer.setInterval(250)
+        self._action_timer.timeout.connect(self._run_pending_actions)
         
         self.build_ui()
     
@@ -127,17 +513,15 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         banner = Banner("RigX Rigging Validator", "../icons/rigX_icon_validator.png")
         layout.addWidget(banner)
         
+        # Without a validator none of the controls below can do anything
+        if not self.validator:
+            layout.addWidget(QtWidgets.QLabel("No validator configured"))
+            layout.addStretch()
+            return
+        
         # ───── Main Splitter for Validations and Results ─────
         self.main_splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical)
-        self.main_splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #2A2A2A ;
-                height: 3px;
-            }
-            QSplitter::handle:hover {
-                background-color: #666666;
-            }
-        """)
+        self.main_splitter.setObjectName("mainSplitter")
         
         # ───── Validations ─────
         validations_group = QtWidgets.QGroupBox("Validations")
@@ -146,36 +530,18 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         # Add Check All checkbox directly under validations
         self.checkbox_check_all = QtWidgets.QCheckBox("Check All")
         self.checkbox_check_all.clicked.connect(self.toggle_all_modules)
-        self.checkbox_check_all.setStyleSheet("""
-            QCheckBox {
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #2A2A2A ;
-                background-color: #2b2b2b;
-                border-radius: 4px;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #4CAF50;
-                background-color: #4CAF50;
-                border-radius: 4px;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #666666;
-            }
-        """)
+        self.checkbox_check_all.setObjectName("checkAll")
         
         validations_layout.addWidget(self.checkbox_check_all)
         
-        if self.validator:
-            self.build_validations_list(validations_layout)
+        # Scroll area for the module rows. The rows themselves are built on
+        # first show (see showEvent) so the window can paint before the
+        # per-module widgets are created
+        self.validations_scroll = QtWidgets.QScrollArea()
+        self.validations_scroll.setWidgetResizable(True)
+        self.validations_scroll.setObjectName("validationsScroll")
+        self.validations_scroll.setWidget(QtWidgets.QLabel("Loading validations..."))
+        validations_layout.addWidget(self.validations_scroll)
         
         self.main_splitter.addWidget(validations_group)
         
@@ -183,87 +549,21 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         button_layout = QtWidgets.QHBoxLayout()
         
         self.btn_validate = QtWidgets.QPushButton("Run Validation")
-        self.btn_validate.clicked.connect(self.run_validation)
-        self.btn_validate.setStyleSheet("""
-            QPushButton { 
-                background-color: #404040; 
-                color: #e0e0e0; 
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            QPushButton:pressed {
-                background-color: #2A2A2A ;
-            }
-        """)
+        self.btn_validate.clicked.connect(self._request_validation)
+        self.btn_validate.setObjectName("btnValidate")
         
         self.btn_fix = QtWidgets.QPushButton("Fix Issues")
-        self.btn_fix.clicked.connect(self.fix_issues)
+        self.btn_fix.clicked.connect(self._request_fix_issues)
         self.btn_fix.setEnabled(False)  # Disabled by default
-        self.btn_fix.setStyleSheet("""
-            QPushButton { 
-                background-color: #4CAF50; 
-                color: #e0e0e0; 
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #66bb6a;
-            }
-            QPushButton:pressed {
-                background-color: #388e3c;
-            }
-            QPushButton:disabled {
-                background-color: #2A2A2A ;
-                color: #a0a0a0;
-                border: 1px solid #404040;
-            }
-        """)
+        self.btn_fix.setObjectName("btnFix")
         
         self.btn_clear = QtWidgets.QPushButton("Clear Results")
-        self.btn_clear.clicked.connect(lambda: self.clear_results("both"))
-        self.btn_clear.setStyleSheet("""
-            QPushButton { 
-                background-color: #404040; 
-                color: #e0e0e0; 
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
+        self.btn_clear.clicked.connect(self._clear_both)
+        self.btn_clear.setObjectName("btnClear")
         
         self.btn_interactive = QtWidgets.QPushButton("Feedback Validation")
         self.btn_interactive.clicked.connect(self.run_interactive_validation)
-        self.btn_interactive.setStyleSheet("""
-            QPushButton { 
-                background-color: #4CAF50; 
-                color: #e0e0e0; 
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #60AF69;
-            }
-            QPushButton:pressed {
-                background-color: #1976d2;
-            }
-        """)
+        self.btn_interactive.setObjectName("btnInteractive")
         
         button_layout.addWidget(self.btn_validate)
         button_layout.addWidget(self.btn_interactive)
@@ -280,31 +580,18 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         # Results header with folder icon
         results_header = QtWidgets.QHBoxLayout()
         results_label = QtWidgets.QLabel("📁 Results")
-        results_label.setStyleSheet("""
-            QLabel {
-                color: #e0e0e0;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        results_label.setObjectName("resultsLabel")
         results_header.addWidget(results_label)
         results_header.addStretch()
         results_layout.addLayout(results_header)
         
         # Results display area
-        self.results_display = QtWidgets.QTextEdit()
-        self.results_display.setStyleSheet("""
-            QTextEdit { 
-                background-color: #2A2A2A ; 
-                border: 1px solid #404040;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 11px;
-                min-height: 150px;
-                color: #e0e0e0;
-            }
-        """)
+        self.results_display = QtWidgets.QPlainTextEdit()
+        self.results_display.setObjectName("resultsDisplay")
         self.results_display.setReadOnly(True)
+        self.results_display.setMaximumBlockCount(5000)
+        # Read-only log: no undo stack to grow with every appended run
+        self.results_display.setUndoRedoEnabled(False)
         results_layout.addWidget(self.results_display)
         
         self.main_splitter.addWidget(results_group)
@@ -313,311 +600,114 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         self.main_splitter.setSizes([700, 300])
         
         layout.addWidget(self.main_splitter)
-        
-        # Set initial state of Check All checkbox
-        if self.validator:
-            self.update_check_all_state()
-            self.reset_all_module_statuses()
     
-    def build_validations_list(self, parent_layout):
-        """Build the validations list with individual items"""
-        if not self.validator:
-            return
-        
+    def showEvent(self, event):
+        """Build the validation rows the first time the window is shown"""
+        super().showEvent(event)
+        if self.validator and not self._rows_built:
+            self._rows_built = True
+            # Defer to the next event-loop tick so the window paints first
+            QtCore.QTimer.singleShot(0, self.build_validations_list)
+    
+    def _discover_modules(self):
+        """Return the modules to list, filtered and sorted by priority"""
         # Get all modules in a single list (no tabs)
         all_modules = []
         categories = self.validator.get_modules_by_category()
         for category_name, modules in categories.items():
             all_modules.extend(modules)
         
-        # Filter out specific modules that should not be displayed
-        excluded_modules = [
-            'dpColorSetCleaner',
-            'dpColorPerVertexCleaner',
-            'dpControllerTag', 
-            'dpFreezeTransform',
-            'dpGeometryHistory',
-            'dpJointEndCleaner',
-            'dpTweakNodeCleaner'
+        # Remove modules that should not be displayed
+        filtered_modules = [
+            module for module in all_modules
+            if not (module.name in EXCLUDED_MODULES or EXCLUDED_PATTERN_RE.search(module.name))
         ]
         
-        # Also check for partial matches and different case variations
-        excluded_patterns = [
-            'colorset', 'colorpervertex', 'controller', 'freeze', 'geometry'
-        ]
+        # Sort modules by priority order
+        rank = self._validator_module.PRIORITY_RANK
+        filtered_modules.sort(key=lambda module: rank.get(module.clean_name, 999))
+        return filtered_modules
+    
+    def build_validations_list(self):
+        """Build the validations list with individual items"""
+        if not self.validator:
+            return
+        
+        filtered_modules = self._discover_modules()
         
-        # Remove excluded modules
-        filtered_modules = []
-        for module in all_modules:
-            should_exclude = False
+        # Create scroll area for all validations
+        scroll_widget = QtWidgets.QWidget()
+        # One grid for every row: checkbox, Verify, Fix, status, then a stretch column
+        scroll_layout = QtWidgets.QGridLayout(scroll_widget)
+        scroll_layout.setHorizontalSpacing(5)
+        
+        # Add each validation module
+        for row, module in enumerate(filtered_modules):
+            # Module checkbox
+            checkbox = QtWidgets.QCheckBox(module.clean_name)
+            checkbox.setObjectName("moduleCheckBox")
+            checkbox.setChecked(module.enabled)
             
-            # Check exact name match
-            if module.name in excluded_modules:
-                should_exclude = True
+            # Connect checkbox to module enabled state
+            checkbox.toggled.connect(partial(self.toggle_module, module))
             
-            # Check partial pattern match (case insensitive)
-            module_lower = module.name.lower()
-            for pattern in excluded_patterns:
-                if pattern in module_lower:
-                    should_exclude = True
-                    break
+            # Get description for this module
+            description = self.get_validation_description(module.clean_name)
+            checkbox.setToolTip(description)
             
-            if not should_exclude:
-                filtered_modules.append(module)
-        
-        # Debug: Print what was filtered out
-        filtered_out = [module.name for module in all_modules if module.name not in [m.name for m in filtered_modules]]
-        if filtered_out:
-            print(f"Filtered out validation modules: {filtered_out}")
-        
-        print(f"Total modules: {len(all_modules)}, Filtered modules: {len(filtered_modules)}")
-        
-        # Sort modules by priority order (same as in validator)
-        priority_order = [
-            # Priority validations (in order)
-            "AssetChecker",
-            "ReferencedFileChecker", "NamespaceCleaner", "DupicatedName",
-            "KeyframeCleaner", "UnknownNodesCleaner", "UnusedNodeCleaner", 
-            "NgSkinToolsCleaner",
-            # Rest all (in alphabetical order for consistency)
-            "BindPoseCleaner", "CharacterSet", "ColorSetCleaner", "ControllerTag", 
-            "DisplayLayers", "FreezeTransform", "GeometryHistory", "HideAllJoints", 
-            "JointEndCleaner", "OutlinerCleaner", "PruneSkinWeights", 
-            "TweakNodeCleaner", "UnusedSkinCleaner"
-        ]
-        
-        def get_priority_index(module):
-            module_name = module.name.replace('dp', '')
-            try:
-                return priority_order.index(module_name)
-            except ValueError:
-                return 999  # Put unknown modules at the end
+            # Verify button for this module
+            verify_btn = QtWidgets.QPushButton("Verify")
+            verify_btn.setObjectName("verifyBtn")
+            verify_btn.setFixedSize(70, 25)
+            verify_btn.setProperty("moduleName", module.name)
+            verify_btn.clicked.connect(self._on_verify_clicked)
+            
+            # Fix button for this module
+            fix_btn = QtWidgets.QPushButton("Fix")
+            fix_btn.setObjectName("fixBtn")
+            fix_btn.setFixedSize(70, 25)
+            fix_btn.setProperty("moduleName", module.name)
+            fix_btn.clicked.connect(self._on_fix_clicked)
+            
+            # Status button (tick/checkmark/X/warning)
+            status_btn = QtWidgets.QPushButton("✓")
+            status_btn.setObjectName("statusBtn")
+            status_btn.setFixedSize(25, 25)
+            status_btn.setEnabled(False)  # Disabled by default, only shows status
+            
+            # Store buttons for later access
+            self.module_checkboxes[module.name] = checkbox
+            self.module_verify_buttons[module.name] = verify_btn
+            self.module_fix_buttons[module.name] = fix_btn
+            self.module_status_buttons[module.name] = status_btn
+            # Initialize verified state
+            self.module_verified[module.name] = False
+            
+            # Set initial button states
+            verify_btn.setEnabled(checkbox.isChecked())
+            # Fix is disabled until this module is verified
+            fix_btn.setEnabled(False)
+            
+            # Add widgets to this module's grid row
+            scroll_layout.addWidget(checkbox, row, 0)
+            scroll_layout.addWidget(verify_btn, row, 1)
+            scroll_layout.addWidget(fix_btn, row, 2)
+            scroll_layout.addWidget(status_btn, row, 3)
         
-        # Sort modules by priority order
-        filtered_modules.sort(key=get_priority_index)
+        # Trailing column and row soak up the spare space
+        scroll_layout.setColumnStretch(4, 1)
+        scroll_layout.setRowStretch(len(filtered_modules), 1)
         
-        # Create scroll area for all validations
-        scroll_widget = QtWidgets.QWidget()
-        scroll_layout = QtWidgets.QVBoxLayout(scroll_widget)
+        # Swap the placeholder for the populated list
+        self.validations_scroll.setWidget(scroll_widget)
         
-        # Add each validation module
-        for module in filtered_modules:
-                # Create horizontal layout for each module
-                module_layout = QtWidgets.QHBoxLayout()
-                
-                # Module checkbox
-                checkbox = QtWidgets.QCheckBox(module.name.replace('dp', ''))
-                checkbox.setChecked(module.enabled)
-                checkbox.setStyleSheet("""
-                    QCheckBox {
-                        color: #e0e0e0;
-                        font-size: 11px;
-                        padding: 5px;
-                        min-width: 150px;
-                    }
-                    QCheckBox::indicator {
-                        width: 16px;
-                        height: 16px;
-                    }
-                    QCheckBox::indicator:unchecked {
-                        border: 2px solid #404040;
-                        background-color: #2A2A2A ;
-                        border-radius: 3px;
-                    }
-                    QCheckBox::indicator:checked {
-                        border: 2px solid #4CAF50;
-                        background-color: #4CAF50;
-                        border-radius: 3px;
-                    }
-                """)
-                
-                # Connect checkbox to module enabled state
-                checkbox.toggled.connect(lambda checked, m=module: self.toggle_module(m, checked))
-                
-                # Get description for this module
-                module_name = module.name.replace('dp', '')
-                description = self.get_validation_description(module_name)
-                checkbox.setToolTip(description)
-                
-                # Verify button for this module
-                verify_btn = QtWidgets.QPushButton("Verify")
-                verify_btn.setFixedSize(70, 25)
-                verify_btn.clicked.connect(self.create_verify_connection(module))
-                verify_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #404040; 
-                        color: #e0e0e0; 
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 10px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #505050;
-                    }
-                    QPushButton:pressed {
-                        background-color: #2A2A2A ;
-                    }
-                    QPushButton:disabled {
-                        background-color: #2A2A2A ;
-                        color: #a0a0a0;
-                        border: 1px solid #404040;
-                    }
-                """)
-                
-                # Fix button for this module
-                fix_btn = QtWidgets.QPushButton("Fix")
-                fix_btn.setFixedSize(70, 25)
-                fix_btn.clicked.connect(self.create_fix_connection(module))
-                fix_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #4CAF50; 
-                        color: #e0e0e0; 
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 10px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #66bb6a;
-                    }
-                    QPushButton:pressed {
-                        background-color: #388e3c;
-                    }
-                    QPushButton:disabled {
-                        background-color: #2A2A2A ;
-                        color: #a0a0a0;
-                        border: 1px solid #404040;
-                    }
-                """)
-                
-                # Status button (tick/checkmark/X/warning)
-                status_btn = QtWidgets.QPushButton("✓")
-                status_btn.setFixedSize(25, 25)
-                status_btn.setEnabled(False)  # Disabled by default, only shows status
-                status_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #505050; 
-                        color: #e0e0e0; 
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }
-                    QPushButton:disabled {
-                        background-color: #505050;
-                        color: #e0e0e0;
-                    }
-                """)
-                
-                # Store buttons for later access
-                self.module_verify_buttons[module.name] = verify_btn
-                self.module_fix_buttons[module.name] = fix_btn
-                self.module_status_buttons[module.name] = status_btn
-                # Initialize verified state
-                self.module_verified[module.name] = False
-                
-                # Set initial button states
-                verify_btn.setEnabled(checkbox.isChecked())
-                # Fix is disabled until this module is verified
-                fix_btn.setEnabled(False)
-                
-                # Add widgets to module layout with proper spacing
-                module_layout.addWidget(checkbox)
-                module_layout.addSpacing(15)
-                module_layout.addWidget(verify_btn)
-                module_layout.addSpacing(5)
-                module_layout.addWidget(fix_btn)
-                module_layout.addSpacing(5)
-                module_layout.addWidget(status_btn)
-                module_layout.addStretch()
-                
-                # Add module layout to scroll layout
-                scroll_layout.addLayout(module_layout)
-        
-        scroll_layout.addStretch()
-        
-        # Create scroll area
-        scroll_area = QtWidgets.QScrollArea()
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-                QScrollArea {
-                    border: none;
-                    background-color: transparent;
-                }
-                QScrollBar:vertical {
-                    background-color: #2A2A2A ;
-                    width: 12px;
-                    border-radius: 6px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #404040;
-                    border-radius: 6px;
-                    min-height: 20px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background-color: #505050;
-                }
-            """)
-        
-        parent_layout.addWidget(scroll_area)
+        # Set initial state of Check All checkbox
+        self.update_check_all_state()
+        self.reset_all_module_statuses()
     
     def get_validation_description(self, module_name):
         """Get validation description for a module"""
-        validation_descriptions = {
-            # All validations (formerly Model + Rig) - Geometry, mesh, rigging and animation related
-            "ImportReference": "It will check if there are referenced file to import them up.",
-            "NamespaceCleaner": "Check if there are namespaces to clean them up. It won't delete namespace from rigXGuides.",
-            "DupicatedName": "Check if there are nodes with duplicate short names and report them.",
-            "UnlockInitialShadingGroup": "It will unlock the InitialShadingGroup to avoid the blocking to just create a simple polyCube.",
-            "ShowBPCleaner": "It will delete the ShowBP scriptNodes.",
-            
-            "ParentedGeometry": "It will verify if there are some parented geometries in the hierarchy.",
-            "OneVertex": "It will verify if there are some non manifold vertex in the meshes. That means a vertex in the union of 2 shapes.",
-            "TFaceCleaner": "It will verify if there are T faces in the meshes. That means if there's one edge connected to 3 or plus faces. It will fix them.",
-            "LaminaFaceCleaner": "It will verify if there are some lamina faces in the meshes and cleanup them.",
-            "NonManifoldCleaner": "It will verify if there are polygons with non-manifold issues and remove them.",
-            "NonQuadFace": "It will find non quad polygon faces. These cannot be fixed automatically and require manual attention.",
-            "BorderGap": "It will find borders or holes in the mesh. These cannot be fixed automatically, but you can try to use the fill hole Maya command to fix them.",
-            "RemainingVertexCleaner": "It will verify if there are some remaining vertex in the meshes. It means have one vertex connected to only 2 non border edges.",
-            "UnlockNormals": "It will unlock normals from the geometries.",
-            "InvertedNormals": "It will verify inverted normals in the geometries.",
-            "SoftenEdges": "It will verify soften edges in the geometries.",
-            "OverrideCleaner": "It will verify if there are nodes with overrides and remove them.",
-            
-            # Additional validations (CheckOut) - Rigging and animation related
-            "CycleChecker": "It will verify if there are cycle errors in the scene. It will only verify and report them as this theme is very complex to fix automatically.",
-            "KeyframeCleaner": "It will delete the animated objects keyframes. It won't check drivenKeys, blendWeights or pairBlends.",
-            "NgSkinToolsCleaner": "It will clean-up all ngSkinTools custom nodes forever.",
-            "BrokenNetCleaner": "It will detect if there are some broken correction manager network to clean-up them.",
-            "HideDataGrp": "It will hide the Data_Grp if it isn't hidden yet.",
-            "SideCalibration": "It will detect if there are some controllers with different side calibration and priorize the setup from the non defaultValue or use the left side as source if the two sides are configured.",
-            "TargetCleaner": "Check if there are blendShape primary targets to clean them up. It will delete not connected or not deformed geometries.",
-            "UnknownNodesCleaner": "It will clean-up the unknown nodes in the scene.",
-            "UnusedNodeCleaner": "It will remove unnecessary rendering nodes and unused animation curves.",
-            "PruneSkinWeights": "It will verify if there are small skinning weights to prune.",
-            "UnusedSkinCleaner": "It will remove unused skin influences.",
-            "EnvelopeChecker": "It will check for envelope attributes lower than one.",
-            "ScalableDeformerChecker": "It will verify if there are deformers with scalable connections in the scene. It will check and fix the scalable connections to deformers: skinCluster and deltaMush.",
-            "WIPCleaner": "Check if there are any node inside of the WIP_Grp and delete them.",
-            "ExitEditMode": "It will check if there are any corrective controller in the edit mode and it will back to normal state without save changes or settings.",
-            "HideCorrectives": "It will lock and hide the corrective attribute on Option_Ctrl",
-            "ControlsHierarchy": "Check if controls hierarchy match with a previous state exported, to prevent animation loss.",
-            "DisplayLayers": "It will check that no display layers exist in the scene (except the default layer). If any display layers are found, it will report them and clear them to keep the scene clean.",
-            "ResetPose": "It will reset the rig to its default pose.",
-            "BindPoseCleaner": "It will verify if there are bindPose nodes in the scene. If so, it will delete them and create just a new one node for all skinned joints.",
-            "RemapValueToSetRange": "It will verify if there are remapValue nodes that could be converted to setRange nodes without losing any behavior. It will optimize the calculation and get a faster rig.",
-            "HideAllJoints": "It will hide joints in the scene.",
-            "PassthroughAttributes": "It will verify if there are attributes with no necessary inbetween connections. If so, it will change (a -> b -> c) to (a -> c).",
-            "ProxyCreator": "Creates proxy geometry for performance optimization during rigging.",
-            "Cleanup": "It will check for rigXDeleteIt attributes and delete their nodes.",
-            "CharacterSet": "Validates and manages character sets for proper rigging workflow. Ensures character sets have proper naming, controls, and joint hierarchies.",
-            "ControlValues": "Check animation set controls for proper TR values (0) and Scale values (1). Ensures all controls are in their default state.",
-            "AssetChecker": "Asset Checker: derive asset from JOB_PATH, verify/rename top node to match.",
-        }
-        
-        return validation_descriptions.get(module_name, "No description available")
+        return VALIDATION_DESCRIPTIONS.get(module_name, "No description available")
     
     def show_help(self, module_name, description):
         """Show help information for a validation module"""
@@ -629,9 +719,15 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         )
     
     def update_check_all_state(self):
-        """Update the Check All checkbox state based on individual module states"""
+        """Schedule a Check All refresh; repeated calls in one tick run it once"""
         if not self.validator or self._updating_check_all:
             return
+        self._check_all_timer.start()
+    
+    def _apply_check_all_state(self):
+        """Update the Check All checkbox state based on individual module states"""
+        if not self.validator:
+            return
         
         # Check if all modules are enabled
         all_enabled = all(module.enabled for module in self.validator.modules.values())
@@ -663,29 +759,57 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         for module in self.validator.modules.values():
             module.enabled = checked
         
-        # Update all checkboxes to match the checked state
-        for child in self.findChildren(QtWidgets.QCheckBox):
-            if child != self.checkbox_check_all:
-                        child.setChecked(checked)
-        
-        # Update all button states
-        for module_name in self.module_verify_buttons:
-            self.module_verify_buttons[module_name].setEnabled(checked)
-        for module_name in self.module_fix_buttons:
-            can_fix = checked and self.module_verified.get(module_name, False)
-            self.module_fix_buttons[module_name].setEnabled(can_fix)
+        # Checkbox and button changes repaint the module list once, at the end
+        with self._updates_frozen(self.validations_scroll):
+            # Update all checkboxes to match the checked state. Signals are blocked
+            # so each setChecked doesn't re-enter toggle_module; module states and
+            # buttons are updated in one pass below instead
+            for child in self.module_checkboxes.values():
+                blocker = QtCore.QSignalBlocker(child)
+                child.setChecked(checked)
+                blocker.unblock()
+            
+            # Update all button states
+            for module_name in self.module_verify_buttons:
+                self.module_verify_buttons[module_name].setEnabled(checked)
+            for module_name in self.module_fix_buttons:
+                can_fix = checked and self.module_verified.get(module_name, False)
+                self.module_fix_buttons[module_name].setEnabled(can_fix)
+    
+    def _debounce(self, key, action):
+        """Schedule action to run once clicks settle; repeat clicks with the same key merge"""
+        self._pending_actions.setdefault(key, action)
+        self._action_timer.start()
+    
+    def _run_pending_actions(self):
+        """Run every distinct debounced request in click order; dropped during an interactive run"""
+        actions, self._pending_actions = list(self._pending_actions.values()), {}
+        for action in actions:
+            if self._interactive_running:
+                return
+            action()
+    
+    def _request_validation(self):
+        """Run Validation button handler"""
+        self._debounce("validate", self.run_validation)
     
-    def create_verify_connection(self, module):
-        """Create a connection function for verify button"""
-        def verify_connection():
-            self.verify_single_module(module)
-        return verify_connection
+    def _request_fix_issues(self):
+        """Fix Issues button handler"""
+        self._debounce("fix_issues", self.fix_issues)
     
-    def create_fix_connection(self, module):
-        """Create a connection function for fix button"""
-        def fix_connection():
-            self.fix_single_module(module)
-        return fix_connection
+    def _sender_module(self):
+        """Return the validation module named by the clicked button's moduleName property"""
+        return self.validator.modules.get(self.sender().property("moduleName"))
+    
+    def _on_verify_clicked(self):
+        """Shared slot for every module's Verify button"""
+        module = self._sender_module()
+        self._debounce(("verify", module), partial(self.verify_single_module, module))
+    
+    def _on_fix_clicked(self):
+        """Shared slot for every module's Fix button"""
+        module = self._sender_module()
+        self._debounce(("fix", module), partial(self.fix_single_module, module))
     
     def verify_single_module(self, module):
         """Verify a single validation module"""
@@ -693,7 +817,8 @@ class RiggingValidatorUI(QtWidgets.QWidget):
             return
         
         # Run validation for this specific module
-        results = self.validator.run_validation(module_names=[module.name], mode="check", objList=None)
+        with suspend_viewport_refresh():
+            results = self.validator.run_validation(module_names=[module.name], mode="check", objList=None)
         
         # Update module status based on results
         if results and module.name in results:
@@ -703,6 +828,7 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         
         # Display results
         self.display_results(action_type="verify")
+        self._flush_log(replace=True)
         
         # Mark this module as verified and enable its Fix button
         self.module_verified[module.name] = True
@@ -711,11 +837,6 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         # Keep global Fix Issues button behavior unchanged
         self._did_verify = True
         self.btn_fix.setEnabled(True)
-        
-        # Module verification completed
-        clean_name = module.name.replace('dp', '')
-        consolidated_results = self.validator.get_consolidated_results()
-        print(f"Verified {clean_name} - {len(consolidated_results['info'])} items found")
     
     def fix_single_module(self, module):
         """Fix issues for a single validation module"""
@@ -723,28 +844,22 @@ class RiggingValidatorUI(QtWidgets.QWidget):
             return
         
         # Duplicate Name validation: only show manual-fix dialog if actual duplicates exist
-        clean_name = module.name.replace('dp', '')
+        clean_name = module.clean_name
         if "DuplicatedName" in clean_name or "DupicatedName" in clean_name:
             check_results = self.validator.run_validation(module_names=[module.name], mode="check", objList=None)
             has_actual_duplicates = False
             if check_results and module.name in check_results:
                 result = check_results[module.name]
                 for issue in result.get('issues', []):
-                    msg = issue.get('message', '').lower()
-                    if any(phrase in msg for phrase in [
-                        "no duplicate names found",
-                        "passed - no issues",
-                        "no issues found",
-                        "clean - no issues",
-                        "nothing to clean"
-                    ]):
+                    if CLEAN_PHRASE_RE.search(issue.get('message', '')):
                         continue
                     has_actual_duplicates = True
                     break
             if not has_actual_duplicates:
                 # Nothing to fix; mark as pass and inform user
                 self.update_module_status(module.name, 'pass')
-                self.results_display.append(f"✅ {clean_name}: No duplicate names found")
+                self._pending_log.append(f"✅ {clean_name}: No duplicate names found")
+                self._flush_log()
                 return
             # Actual duplicates exist; prompt manual fix and skip auto-fix
             QtWidgets.QMessageBox.information(
@@ -753,11 +868,13 @@ class RiggingValidatorUI(QtWidgets.QWidget):
                 "Duplicate short names cannot be auto-fixed.\nPlease rename manually so each has a unique short name."
             )
             self.update_module_status(module.name, 'warning')
-            self.results_display.append(f"ℹ️ {clean_name}: Manual fix required for duplicate short names")
+            self._pending_log.append(f"ℹ️ {clean_name}: Manual fix required for duplicate short names")
+            self._flush_log()
             return
 
         # Run validation in fix mode for this specific module
-        results = self.validator.run_validation(module_names=[module.name], mode="fix", objList=None)
+        with suspend_viewport_refresh():
+            results = self.validator.run_validation(module_names=[module.name], mode="fix", objList=None)
         
         # Update module status based on fix results
         if results and module.name in results:
@@ -767,46 +884,77 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         
         # Display results
         self.display_results(action_type="fix")
-        
-        # Module fix completed
-        clean_name = module.name.replace('dp', '')
-        consolidated_results = self.validator.get_consolidated_results()
-        print(f"Fixed {clean_name} - {len(consolidated_results['info'])} items processed")
+        self._flush_log(replace=True)
+    
+    def _set_actions_enabled(self, enabled):
+        """Enable or disable the action buttons; Fix Issues also needs a prior verify"""
+        self.btn_validate.setEnabled(enabled)
+        self.btn_interactive.setEnabled(enabled)
+        self.btn_clear.setEnabled(enabled)
+        self.btn_fix.setEnabled(enabled and self._did_verify)
+    
+    def _set_modules_enabled(self, enabled):
+        """Enable or disable the module rows (checkboxes, Verify, Fix) and Check All"""
+        self.validations_scroll.setEnabled(enabled)
+        self.checkbox_check_all.setEnabled(enabled)
+    
+    @contextmanager
+    def _updates_frozen(self, widget):
+        """Hold repaints of widget for the block; it repaints once when re-enabled"""
+        widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            widget.setUpdatesEnabled(True)
+    
+    @contextmanager
+    def _busy(self):
+        """Disable the action buttons and show a wait cursor while a run is in progress"""
+        self._set_actions_enabled(False)
+        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        try:
+            yield
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+            self._set_actions_enabled(True)
     
     def run_validation(self):
         """Run validation on all enabled modules"""
         if not self.validator:
             return
             
-        # Clear previous results
-        self.results_display.clear()
-            
-        # Run validation
-        results = self.validator.run_all_validations()
-        
-        # Update all module statuses based on results
-        if results:
-            for module_name in results:
-                if module_name in self.module_status_buttons:
-                    self.update_module_status_from_results(module_name, results[module_name])
-                    # Mark modules that were part of this run as verified so their Fix buttons can be enabled
-                    self.module_verified[module_name] = True
-                    if module_name in self.module_fix_buttons:
-                        self.module_fix_buttons[module_name].setEnabled(True)
-        
-        # Display results
-        self.display_results(action_type="validate")
+        with self._busy():
+            # Run validation
+            with suspend_viewport_refresh():
+                results = self.validator.run_all_validations()
+        
+            # Update all module statuses based on results
+            if results:
+                with self._updates_frozen(self.validations_scroll):
+                    for module_name in results:
+                        if module_name in self.module_status_buttons:
+                            self.update_module_status_from_results(module_name, results[module_name])
+                            # Mark modules that were part of this run as verified so their Fix buttons can be enabled
+                            self.module_verified[module_name] = True
+                            if module_name in self.module_fix_buttons:
+                                self.module_fix_buttons[module_name].setEnabled(True)
+        
+            # Display results
+            self.display_results(action_type="validate")
+            self._flush_log(replace=True)
         
         # Enable global Fix Issues after a full validation run
         self._did_verify = True
         self.btn_fix.setEnabled(True)
-        
-        print("Validation completed")
     
     def run_interactive_validation(self):
         """Run interactive validation - step by step with user interaction"""
         if not self.validator:
             return
+        
+        # Clicks debounced just before this one must not fire mid-run
+        self._action_timer.stop()
+        self._pending_actions = {}
             
         # Clear previous results
         self.results_display.clear()
@@ -820,511 +968,367 @@ class RiggingValidatorUI(QtWidgets.QWidget):
                     enabled_modules.append(module)
         
         # Sort by priority order (same as in build_validations_list)
-        priority_order = [
-            "AssetChecker", "ReferencedFileChecker", "NamespaceCleaner", "DupicatedName", 
-            "KeyframeCleaner", "UnknownNodesCleaner", "UnusedNodeCleaner", 
-            "NgSkinToolsCleaner", "BindPoseCleaner", "CharacterSet", 
-            "DisplayLayers", "HideAllJoints", "OutlinerCleaner", 
-            "PruneSkinWeights", "UnusedSkinCleaner"
-        ]
+        rank = self._validator_module.PRIORITY_RANK
+        enabled_modules.sort(key=lambda module: rank.get(module.clean_name, 999))
+        
+        # Check every module in one pass up front; a module is only re-checked on its
+        # own turn once a fix earlier in the run may have changed the scene
+        with suspend_viewport_refresh():
+            self._interactive_results = self.validator.run_validation(
+                module_names=[module.name for module in enabled_modules], mode="check") or {}
+        self._interactive_scene_changed = False
+        
+        # Walk the modules one per event-loop tick so the window repaints between them
+        self._interactive_queue = enabled_modules
+        self._interactive_cancelled = False
+        self._interactive_running = True
+        self._set_actions_enabled(False)
+        # The run yields to the event loop between modules, so the module rows and
+        # Check All are locked too; a Verify/Fix/toggle mid-run would overwrite the
+        # log or change the scene behind the up-front results
+        self._set_modules_enabled(False)
+        QtCore.QTimer.singleShot(0, self._interactive_step)
+    
+    def _interactive_step(self):
+        """Check the next queued module, then schedule the following one"""
+        if self._interactive_cancelled or not self._interactive_queue:
+            self._finish_interactive()
+            return
         
-        def get_priority_index(module):
-            module_name = module.name.replace('dp', '')
-            try:
-                return priority_order.index(module_name)
-            except ValueError:
-                return 999
+        module = self._interactive_queue.pop(0)
+        if not self._interactive_check_module(module):
+            self._interactive_cancelled = True
+        self._flush_log()
+        QtCore.QTimer.singleShot(0, self._interactive_step)
+    
+    def _finish_interactive(self):
+        """Wrap up an interactive run"""
+        self._interactive_queue = []
+        self._interactive_results = {}
+        self._interactive_running = False
+        self._flush_log()
+        self._set_modules_enabled(True)
+        self._set_actions_enabled(True)
         
-        enabled_modules.sort(key=get_priority_index)
+        # Do not enable Fix Issues here; only enable after a Verify action
+    
+    def _interactive_check_module(self, module):
+        """Check one module and prompt for its issues; return False if the user stopped the run"""
+        clean_name = module.clean_name
         
-        # Run validations one by one
-        for module in enabled_modules:
-            clean_name = module.name.replace('dp', '')
-            
-            # Run validation for this module
+        # Use the up-front check unless an earlier fix may have changed this module's result
+        if self._interactive_scene_changed:
             results = self.validator.run_validation(module_names=[module.name], mode="check")
-            # Mark this module as verified and enable Fix
-            self.module_verified[module.name] = True
-            if module.name in self.module_fix_buttons:
-                self.module_fix_buttons[module.name].setEnabled(True)
+        else:
+            results = self._interactive_results
+        # Mark this module as verified and enable Fix
+        self.module_verified[module.name] = True
+        if module.name in self.module_fix_buttons:
+            self.module_fix_buttons[module.name].setEnabled(True)
+        
+        if results and module.name in results:
+            result = results[module.name]
             
-            if results and module.name in results:
-                result = results[module.name]
-                
-                # Update module status
-                self.update_module_status_from_results(module.name, result)
+            # Update module status
+            self.update_module_status_from_results(module.name, result)
+            
+            # Check if there are issues
+            if result.get('total_issues', 0) > 0:
+                # Check if these are actual issues or just informational "clean" messages
+                actual_issues = []
+                for issue in result.get('issues', []):
+                    # Skip messages that indicate normal/clean state
+                    is_actual_issue = CLEAN_PHRASE_RE.search(issue.get('message', '')) is None
+                    
+                    if is_actual_issue:
+                        actual_issues.append(issue)
                 
-                # Check if there are issues
-                if result.get('total_issues', 0) > 0:
-                    # Check if these are actual issues or just informational "clean" messages
-                    actual_issues = []
-                    for issue in result.get('issues', []):
-                        message = issue.get('message', '').lower()
-                        # Skip messages that indicate normal/clean state
-                        skip_phrases = [
-                            "no duplicate names found",
-                            "no custom namespaces found",
-                            "no bind pose nodes found",
-                            "no display layers found",
-                            "no joints found to check",
-                            "no animation curves found",
-                            "no NgSkinTools nodes found",
-                            "No NgSkinTools nodes found",
-                            "no ngskintools nodes found",
-                            "outliner is already well organized",
-                            "outliner already clean",
-                            "outliner is clean: only",
-                            "all character sets are properly configured",
-                            "no character sets found in scene",
-                            "no skin clusters found to check",
-                            "no references found in scene",
-                            "no tweak nodes found to check",
-                            "no unknown nodes found to check",
-                            "not enough materials to check",
-                            "fixed: 0 nodes = 0 materials",
-                            "no low weights found",
-                            "no unused materials found",
-                            "has no unused influence joints",
-                            "no issues found",
-                            "nothing to clean",
-                            "no problems detected",
-                            "clean - no issues",
-                            "passed - no issues",
-                            "no action needed",
-                            "already clean",
-                            "is already well organized",
-                            "already well organized",
-                            "no action required",
-                            "nothing to fix",
-                            "no fixes needed",
-                            "no cleanup needed",
-                            "no cleanup required",
-                            "no changes needed",
-                            "no changes required",
-                            "all validations passed",
-                            "validation passed",
-                            "passed successfully",
-                            "successfully passed",
-                            "no errors found",
-                            "no warnings found",
-                            "no problems found",
-                            "no issues detected",
-                            "no problems detected",
-                            "no errors detected",
-                            "no warnings detected"
-                        ]
-                        
-                        is_actual_issue = True
-                        for phrase in skip_phrases:
-                            if phrase.lower() in message:
-                                is_actual_issue = False
-                                break
-                        
-                        if is_actual_issue:
-                            actual_issues.append(issue)
+                # Only show dialog if there are actual issues
+                if actual_issues:
+                    # Check for specific FaceControlSet missing message first
+                    face_control_set_issue = None
+                    for issue in actual_issues:
+                        if "missing 'facecontrolset'" in issue.get('message', '').lower():
+                            face_control_set_issue = issue
+                            break
                     
-                    # Only show dialog if there are actual issues
-                    if actual_issues:
-                        # Check for specific FaceControlSet missing message first
-                        face_control_set_issue = None
+                    # Show progress so far before blocking on a dialog
+                    self._flush_log()
+                    
+                    if face_control_set_issue:
+                        # Directly show FaceControlSet dialog
+                        dialog_result = cmds.confirmDialog(
+                            title=f"FaceControlSet Missing - {clean_name}",
+                            message=f"The validation '{clean_name}' found that 'FaceControlSet' is missing.\n\nWould you like to create it or skip for now?",
+                            button=["Create FaceControlSet", "Skip for Now", "Stop Validation"],
+                            defaultButton="Create FaceControlSet",
+                            cancelButton="Stop Validation",
+                            dismissString="Stop Validation"
+                        )
+                        
+                        if dialog_result == "Create FaceControlSet":
+                            # Run fix mode to create FaceControlSet
+                            fix_results = self.validator.run_validation(module_names=[module.name], mode="fix")
+                            self._interactive_scene_changed = True
+                            if fix_results and module.name in fix_results:
+                                self.update_module_status_from_results(module.name, fix_results[module.name])
+                            self._pending_log.append(f"✅ {clean_name}: Created FaceControlSet")
+                        elif dialog_result == "Skip for Now":
+                            self._pending_log.append(f"⚠️ {clean_name}: Skipped FaceControlSet creation")
+                        elif dialog_result == "Stop Validation":
+                            self._pending_log.append(f"🛑 Validation stopped by user at {clean_name}")
+                            return False
+                    else:
+                        # There are actual issues - show dialog for user action
+                        issues_text = ""
                         for issue in actual_issues:
-                            if "missing 'facecontrolset'" in issue.get('message', '').lower():
-                                face_control_set_issue = issue
-                                break
+                            issues_text += f"• {issue.get('message', 'Unknown issue')} - {issue.get('object', 'Unknown object')}\n"
                         
-                        if face_control_set_issue:
-                            # Directly show FaceControlSet dialog
+                        # Show dialog with options based on module type
+                        if "ReferencedFileChecker" in module.name:
                             dialog_result = cmds.confirmDialog(
-                                title=f"FaceControlSet Missing - {clean_name}",
-                                message=f"The validation '{clean_name}' found that 'FaceControlSet' is missing.\n\nWould you like to create it or skip for now?",
-                                button=["Create FaceControlSet", "Skip for Now", "Stop Validation"],
-                                defaultButton="Create FaceControlSet",
+                                title=f"Reference Files Found - {clean_name}",
+                                message=f"The validation '{clean_name}' found {len(actual_issues)} reference(s):\n\n{issues_text}\nWhat would you like to do?",
+                                button=["Import References", "Remove References", "Skip for Now", "Stop Validation"],
+                                defaultButton="Import References",
                                 cancelButton="Stop Validation",
                                 dismissString="Stop Validation"
                             )
                             
-                            if dialog_result == "Create FaceControlSet":
-                                # Run fix mode to create FaceControlSet
-                                fix_results = self.validator.run_validation(module_names=[module.name], mode="fix")
+                            if dialog_result == "Import References":
+                                # Run fix mode to import references
+                                fix_results = self.validator.run_validation(module_names=[module.name], mode="fix", action="import")
+                                self._interactive_scene_changed = True
+                                if fix_results and module.name in fix_results:
+                                    self.update_module_status_from_results(module.name, fix_results[module.name])
+                                self._pending_log.append(f"✅ {clean_name}: Imported references")
+                            elif dialog_result == "Remove References":
+                                # Run fix mode to remove references
+                                fix_results = self.validator.run_validation(module_names=[module.name], mode="fix", action="remove")
+                                self._interactive_scene_changed = True
                                 if fix_results and module.name in fix_results:
                                     self.update_module_status_from_results(module.name, fix_results[module.name])
-                                self.results_display.append(f"✅ {clean_name}: Created FaceControlSet")
+                                self._pending_log.append(f"✅ {clean_name}: Removed references")
                             elif dialog_result == "Skip for Now":
-                                self.results_display.append(f"⚠️ {clean_name}: Skipped FaceControlSet creation")
+                                self._pending_log.append(f"⚠️ {clean_name}: Skipped by user")
                             elif dialog_result == "Stop Validation":
-                                self.results_display.append(f"🛑 Validation stopped by user at {clean_name}")
-                                break
+                                self._pending_log.append(f"🛑 Validation stopped by user at {clean_name}")
+                                return False
                         else:
-                            # There are actual issues - show dialog for user action
-                            issues_text = ""
-                            for issue in actual_issues:
-                                issues_text += f"• {issue.get('message', 'Unknown issue')} - {issue.get('object', 'Unknown object')}\n"
+                            # Generic dialog for other modules
+                            dialog_result = cmds.confirmDialog(
+                                title=f"Validation Issues Found - {clean_name}",
+                                message=f"The validation '{clean_name}' found {len(actual_issues)} issue(s):\n\n{issues_text}\nWhat would you like to do?",
+                                button=["Fix Issues", "Skip for Now", "Stop Validation"],
+                                defaultButton="Fix Issues",
+                                cancelButton="Stop Validation",
+                                dismissString="Stop Validation"
+                            )
                             
-                            # Show dialog with options based on module type
-                            if "ReferencedFileChecker" in module.name:
-                                dialog_result = cmds.confirmDialog(
-                                    title=f"Reference Files Found - {clean_name}",
-                                    message=f"The validation '{clean_name}' found {len(actual_issues)} reference(s):\n\n{issues_text}\nWhat would you like to do?",
-                                    button=["Import References", "Remove References", "Skip for Now", "Stop Validation"],
-                                    defaultButton="Import References",
-                                    cancelButton="Stop Validation",
-                                    dismissString="Stop Validation"
-                                )
-                                
-                                if dialog_result == "Import References":
-                                    # Run fix mode to import references
-                                    fix_results = self.validator.run_validation(module_names=[module.name], mode="fix", action="import")
-                                    if fix_results and module.name in fix_results:
-                                        self.update_module_status_from_results(module.name, fix_results[module.name])
-                                    self.results_display.append(f"✅ {clean_name}: Imported references")
-                                elif dialog_result == "Remove References":
-                                    # Run fix mode to remove references
-                                    fix_results = self.validator.run_validation(module_names=[module.name], mode="fix", action="remove")
+                            if dialog_result == "Fix Issues":
+                                # For duplicate name validation, show manual fix prompt and skip auto-fix
+                                if "DuplicatedName" in clean_name or "DupicatedName" in clean_name:
+                                    QtWidgets.QMessageBox.information(
+                                        self,
+                                        "Manual Fix Required",
+                                        "Duplicate short names cannot be auto-fixed.\nPlease rename manually so each has a unique short name."
+                                    )
+                                    self.update_module_status(module.name, 'warning')
+                                    self._pending_log.append(f"ℹ️ {clean_name}: Manual fix required for duplicate short names")
+                                else:
+                                    # Run fix mode
+                                    fix_results = self.validator.run_validation(module_names=[module.name], mode="fix")
+                                    self._interactive_scene_changed = True
                                     if fix_results and module.name in fix_results:
                                         self.update_module_status_from_results(module.name, fix_results[module.name])
-                                    self.results_display.append(f"✅ {clean_name}: Removed references")
-                                elif dialog_result == "Skip for Now":
-                                    self.results_display.append(f"⚠️ {clean_name}: Skipped by user")
-                                elif dialog_result == "Stop Validation":
-                                    self.results_display.append(f"🛑 Validation stopped by user at {clean_name}")
-                                    break
-                            else:
-                                # Generic dialog for other modules
-                                dialog_result = cmds.confirmDialog(
-                                    title=f"Validation Issues Found - {clean_name}",
-                                    message=f"The validation '{clean_name}' found {len(actual_issues)} issue(s):\n\n{issues_text}\nWhat would you like to do?",
-                                    button=["Fix Issues", "Skip for Now", "Stop Validation"],
-                                    defaultButton="Fix Issues",
-                                    cancelButton="Stop Validation",
-                                    dismissString="Stop Validation"
-                                )
-                                
-                                if dialog_result == "Fix Issues":
-                                    # For duplicate name validation, show manual fix prompt and skip auto-fix
-                                    if "DuplicatedName" in clean_name or "DupicatedName" in clean_name:
-                                        QtWidgets.QMessageBox.information(
-                                            self,
-                                            "Manual Fix Required",
-                                            "Duplicate short names cannot be auto-fixed.\nPlease rename manually so each has a unique short name."
-                                        )
-                                        self.update_module_status(module.name, 'warning')
-                                        self.results_display.append(f"ℹ️ {clean_name}: Manual fix required for duplicate short names")
-                                    else:
-                                        # Run fix mode
-                                        fix_results = self.validator.run_validation(module_names=[module.name], mode="fix")
-                                        if fix_results and module.name in fix_results:
-                                            self.update_module_status_from_results(module.name, fix_results[module.name])
-                                        self.results_display.append(f"✅ {clean_name}: Issues fixed")
-                                elif dialog_result == "Skip for Now":
-                                    self.results_display.append(f"⚠️ {clean_name}: Skipped by user")
-                                elif dialog_result == "Stop Validation":
-                                    self.results_display.append(f"🛑 Validation stopped by user at {clean_name}")
-                                    break
-                    else:
-                        # All issues were "clean" messages - continue silently
-                        self.results_display.append(f"✅ {clean_name}: Passed")
+                                    self._pending_log.append(f"✅ {clean_name}: Issues fixed")
+                            elif dialog_result == "Skip for Now":
+                                self._pending_log.append(f"⚠️ {clean_name}: Skipped by user")
+                            elif dialog_result == "Stop Validation":
+                                self._pending_log.append(f"🛑 Validation stopped by user at {clean_name}")
+                                return False
                 else:
-                    # No issues - continue silently
-                    self.results_display.append(f"✅ {clean_name}: Passed")
-        
-        # Do not enable Fix Issues here; only enable after a Verify action
+                    # All issues were "clean" messages - continue silently
+                    self._pending_log.append(f"✅ {clean_name}: Passed")
+            else:
+                # No issues - continue silently
+                self._pending_log.append(f"✅ {clean_name}: Passed")
         
-        print("Interactive validation completed")
+        return True
     
     def fix_issues(self):
         """Fix issues for all enabled modules"""
         if not self.validator:
             return
             
-        # Clear previous results
-        self.results_display.clear()
-        
-        # Run fix for all enabled modules
-        results = self.validator.run_validation(mode="fix")
-        
-        # Update all module statuses based on fix results
-        if results:
-            for module_name in results:
-                if module_name in self.module_status_buttons:
-                    self.update_module_status_from_results(module_name, results[module_name])
-        
-        # Re-run validation in check mode to get updated status after fixing
-        print("Re-running validation to check if issues were resolved...")
-        check_results = self.validator.run_validation(mode="check")
-        
-        # Update module statuses based on the new check results
-        if check_results:
-            for module_name in check_results:
-                if module_name in self.module_status_buttons:
-                    self.update_module_status_from_results(module_name, check_results[module_name])
-        
-        # Display the current state after fixing (using check results)
-        self.display_results(action_type="fix", use_check_results=True)
-        
-        print("Fix completed")
+        with self._busy():
+            # Run fix for all enabled modules
+            with suspend_viewport_refresh():
+                results = self.validator.run_validation(mode="fix")
+        
+            # Both status passes repaint the module list once, at the end
+            with self._updates_frozen(self.validations_scroll):
+                # Update all module statuses based on fix results
+                if results:
+                    for module_name in results:
+                        if module_name in self.module_status_buttons:
+                            self.update_module_status_from_results(module_name, results[module_name])
+            
+                # Re-run validation in check mode to get updated status after fixing
+                with suspend_viewport_refresh():
+                    check_results = self.validator.run_validation(mode="check")
+            
+                # Update module statuses based on the new check results
+                if check_results:
+                    for module_name in check_results:
+                        if module_name in self.module_status_buttons:
+                            self.update_module_status_from_results(module_name, check_results[module_name])
+        
+            # Display the current state after fixing (using check results)
+            self.display_results(action_type="fix", use_check_results=True)
+            self._flush_log(replace=True)
     
     def display_results(self, action_type="validate", use_check_results=False):
         """Display validation results in the results area
         
+        Lines are queued on _pending_log; callers write them with _flush_log(replace=True).
+        
         Args:
             action_type (str): Type of action - "validate", "verify", or "fix"
-            use_check_results (bool): If True, use check results instead of fix results for display
+            use_check_results (bool): If True, the caller has just run a check pass after fixing and
+                its results are shown instead of the fix results
         """
         if not self.validator:
             return
-            
-        # If we're in fix mode and want to show current state, get check results
-        if action_type == "fix" and use_check_results:
-            # Temporarily run check to get current state
-            self.validator.run_validation(mode="check")
-            
+        
+        # The validator keeps the results of its most recent run, so a check pass the
+        # caller just made is read back here rather than run a second time
         consolidated_results = self.validator.get_consolidated_results()
-            
-        # Clear previous results
-        self.results_display.clear()
         
-        # Check if there are any issues to report
-        has_errors = bool(consolidated_results.get('errors', []))
+        # Nothing reported and no module still marked failed - skip the filtering below
+        if self._failed_count == 0 and not (
+                consolidated_results.get('errors') or consolidated_results.get('warnings')
+                or consolidated_results.get('info')):
+            self._pending_log.append("✅ All validations passed successfully!")
+            return
         
-        # Filter out warnings that indicate "no issues found" or "nothing to clean"
-        filtered_warnings = []
-        if consolidated_results.get('warnings'):
-            for warning in consolidated_results['warnings']:
-                # Skip warnings that indicate no issues or nothing to clean
-                skip_phrases = [
-                    "No namespaces to clean",
-                    "No display layers to clear", 
-                    "Outliner organized: 0 nodes moved",
-                    "No issues found",
-                    "Nothing to clean",
-                    "No problems detected",
-                    "Clean - no issues",
-                    "Passed - no issues",
-                    "No duplicate names found",
-                    "No custom namespaces found",
-                    "No bind pose nodes found",
-                    "No display layers found",
-                    "No joints found to check",
-                    "No animation curves found",
-                    "No NgSkinTools nodes found",
-                    "Outliner is already well organized",
-                    "Outliner already clean",
-                    "All character sets are properly configured",
-                    "No character sets found in scene",
-                    "No skin clusters found to check",
-                    "No references found in scene",
-                    "No tweak nodes found to check",
-                    "No unknown nodes found to check",
-                    "Not enough materials to check",
-                    "Fixed: 0 nodes = 0 materials"
-                ]
-                
-                should_skip = False
-                for phrase in skip_phrases:
-                    if phrase.lower() in warning.lower():
-                        should_skip = True
-                        break
-                
-                if not should_skip:
-                    filtered_warnings.append(warning)
+        errors = consolidated_results.get('errors') or []
+        warnings = consolidated_results.get('warnings') or []
+        infos = consolidated_results.get('info') or []
+        has_errors = bool(errors)
         
-        has_warnings = bool(filtered_warnings)
+        # A bare "All validations passed" entry means a module already simplified its output
+        simplified_success = ALL_PASSED in errors
+        passed_count = 0  # Per-module "All validations passed" messages
         
         # Filter out "No issues found" messages from info
         filtered_info = []
-        if consolidated_results.get('info'):
-            for info in consolidated_results['info']:
-                # Skip "No issues found" messages
-                if not info.endswith(": No issues found") and not info.endswith("No issues found"):
-                    filtered_info.append(info)
-        
-        has_relevant_info = bool(filtered_info)
-        
-        # Check if any validation module has already simplified the output to just "All validations passed"
-        simplified_success = False
-        
-        # Check info section
-        if consolidated_results.get('info'):
-            for info in consolidated_results['info']:
-                if info == "All validations passed":
+        for info in infos:
+            if ALL_PASSED in info:
+                passed_count += 1
+                if info == ALL_PASSED:
                     simplified_success = True
-                    break
-        
-        # Check warnings section
-        if not simplified_success and consolidated_results.get('warnings'):
-            for warning in consolidated_results['warnings']:
-                if warning == "All validations passed":
-                    simplified_success = True
-                    break
+            if not info.endswith("No issues found"):
+                filtered_info.append(info)
         
-        # Check errors section
-        if not simplified_success and consolidated_results.get('errors'):
-            for error in consolidated_results['errors']:
-                if error == "All validations passed":
+        # Filter out warnings that indicate no issues or nothing to clean; per-module
+        # "All validations passed" warnings are kept so they render as passes
+        filtered_warnings = []
+        all_clean_messages = True  # Every warning is just a "clean" message
+        for warning in warnings:
+            if ALL_PASSED in warning:
+                passed_count += 1
+                if warning == ALL_PASSED:
                     simplified_success = True
-                    break
+                filtered_warnings.append(warning)
+            elif not CLEAN_PHRASE_RE.search(warning):
+                all_clean_messages = False
+                filtered_warnings.append(warning)
         
-        # If simplified success message is found, show it directly
-        if simplified_success:
-            self.results_display.append("✅ All validations passed successfully!")
+        has_warnings = bool(filtered_warnings)
+        has_relevant_info = bool(filtered_info)
+        has_failed_validations = self._failed_count > 0
+        total_validations = len(infos) + len(warnings)
+        
+        # Show a single success line when nothing is left to report: a module simplified
+        # its output, or with no errors or failed modules, either nothing relevant remains,
+        # a fix left only clean messages, or every message is a per-module pass
+        nothing_failed = not has_errors and not has_failed_validations
+        if simplified_success or (nothing_failed and (
+                (not has_warnings and (not has_relevant_info or passed_count >= 1))
+                or (action_type == "fix" and all_clean_messages)
+                or (passed_count > 0 and passed_count == total_validations))):
+            self._pending_log.append("✅ All validations passed successfully!")
             return
         
-        # Check if there are any failed validations (X marks) by looking at module statuses
-        has_failed_validations = False
-        for module_name in self.module_status_buttons:
-            status_btn = self.module_status_buttons[module_name]
-            if status_btn.text() == "✗":  # X mark indicates failed validation
-                has_failed_validations = True
-                break
-        
-        # If no errors, no warnings, no relevant info, and no failed validations, show success message
-        if not has_errors and not has_warnings and not has_relevant_info and not has_failed_validations:
-            self.results_display.append("✅ All validations passed successfully!")
-            return
+        # Display results based on action type
+        self._pending_log.extend(self._render_results(action_type, use_check_results, errors, filtered_warnings, filtered_info))
+    
+    def _render_results(self, action_type, use_check_results, errors, filtered_warnings, filtered_info):
+        """Build the result lines for an action, each prefixed with its status emoji
         
-        # Additional check: If we're in fix mode and all modules passed (no errors, only "clean" messages), show simplified success
-        if action_type == "fix" and not has_errors and not has_failed_validations:
-            # Check if all warnings are just "clean" messages (no issues found, already clean, etc.)
-            all_clean_messages = True
-            if consolidated_results.get('warnings'):
-                clean_indicators = [
-                    "no action needed", "already clean", "no issues found", "no problems detected",
-                    "clean - no issues", "passed - no issues", "no duplicate names found",
-                    "no custom namespaces found", "no bind pose nodes found", "no display layers found",
-                    "no joints found to check", "no animation curves found", "no NgSkinTools nodes found",
-                    "outliner is already well organized", "outliner already clean",
-                    "all character sets are properly configured", "no character sets found in scene",
-                    "no skin clusters found to check", "no references found in scene",
-                    "no tweak nodes found to check", "no unknown nodes found to check",
-                    "not enough materials to check", "fixed: 0 nodes = 0 materials",
-                    "no low weights found", "no unused materials found", "has no unused influence joints"
-                ]
-                
-                for warning in consolidated_results['warnings']:
-                    warning_lower = warning.lower()
-                    is_clean = any(indicator in warning_lower for indicator in clean_indicators)
-                    if not is_clean:
-                        all_clean_messages = False
-                        break
-            
-            if all_clean_messages:
-                self.results_display.append("✅ All validations passed successfully!")
-                return
+        Args:
+            action_type (str): Type of action - "validate", "verify", or "fix"
+            use_check_results (bool): If True, a fix is shown as the post-fix check state
+            errors (list): Error messages
+            filtered_warnings (list): Warnings left after dropping clean messages
+            filtered_info (list): Info messages left after dropping "No issues found"
         
-        # Check if all individual validations passed (all have "All validations passed" messages)
-        passed_count = 0
-        total_validations = 0
-        
-        # Count how many validations have "All validations passed" messages
-        if consolidated_results.get('info'):
-            for info in consolidated_results['info']:
-                if "All validations passed" in info:
-                    passed_count += 1
-                total_validations += 1
-        
-        if consolidated_results.get('warnings'):
-            for warning in consolidated_results['warnings']:
-                if "All validations passed" in warning:
-                    passed_count += 1
-                total_validations += 1
-        
-        # Debug: Print what we found
-        print(f"Debug - passed_count: {passed_count}, total_validations: {total_validations}")
-        print(f"Debug - has_errors: {has_errors}, has_warnings: {has_warnings}, has_failed_validations: {has_failed_validations}")
-        
-        # If all validations passed and there are no errors, show consolidated success
-        if passed_count > 0 and total_validations > 0 and passed_count == total_validations and not has_errors and not has_failed_validations:
-            self.results_display.append("✅ All validations passed successfully!")
-            return
+        Returns:
+            list: Lines to show in the results area
+        """
+        lines = []
+        # Bind the loop lookups once
+        append = lines.append
+        error_prefix = RESULT_PREFIXES["error"]
+        warning_prefix = RESULT_PREFIXES["warning"]
+        pass_prefix = RESULT_PREFIXES["pass"]
+        
+        for error in errors:
+            append(error_prefix + error)
+        
+        if action_type == "fix" and not use_check_results:
+            # Show fix operation results: warnings and info that report a fix get a green tick
+            for warning in filtered_warnings:
+                if FIX_WARNING_PHRASE_RE.search(warning) or ALL_PASSED in warning:
+                    append(pass_prefix + warning)
+                else:
+                    append(warning_prefix + warning)
+            for info in filtered_info:
+                if FIX_PHRASE_RE.search(info):
+                    append(pass_prefix + info)
+                else:
+                    append(RESULT_PREFIXES["info"] + info)
+        else:
+            # Verify, validate and the post-fix check state show errors and filtered warnings only
+            for warning in filtered_warnings:
+                if ALL_PASSED in warning:
+                    append(pass_prefix + warning)
+                else:
+                    append(warning_prefix + warning)
         
-        # Additional check: If we have multiple "All validations passed" messages and no errors/warnings, consolidate
-        if passed_count >= 2 and not has_errors and not has_warnings and not has_failed_validations:
-            self.results_display.append("✅ All validations passed successfully!")
-            return
+        # If no errors and no relevant warnings, show success message (not for a single verify)
+        if action_type != "verify" and not errors and not filtered_warnings:
+            append("✅ All validations passed successfully!")
         
-        # Final check: If we have any "All validations passed" messages and no errors/warnings/failed validations, consolidate
-        if passed_count >= 1 and not has_errors and not has_warnings and not has_failed_validations:
-            self.results_display.append("✅ All validations passed successfully!")
-            return
-        
-        # Display results based on action type
-        if action_type == "verify":
-            # Show verification results - only errors and filtered warnings
-            if has_errors:
-                for error in consolidated_results['errors']:
-                    self.results_display.append(f"❌ {error}")
-            
-            if has_warnings:
-                for warning in filtered_warnings:
-                    # Check if this warning message indicates success
-                    if "All validations passed" in warning:
-                        self.results_display.append(f"✅ {warning}")
-                    else:
-                        self.results_display.append(f"⚠️ {warning}")
-                    
-        elif action_type == "fix":
-            if use_check_results:
-                # Show current state after fixing (what's actually resolved vs. what remains)
-                if has_errors:
-                    for error in consolidated_results['errors']:
-                        self.results_display.append(f"❌ {error}")
-                
-                if has_warnings:
-                    for warning in filtered_warnings:
-                        # Check if this warning message indicates success
-                        if "All validations passed" in warning:
-                            self.results_display.append(f"✅ {warning}")
-                        else:
-                            self.results_display.append(f"⚠️ {warning}")
-                
-                # If no errors and no warnings, show success message
-                if not has_errors and not has_warnings:
-                    self.results_display.append("✅ All validations passed successfully!")
-            else:
-                # Show fix operation results
-                if has_errors:
-                    for error in consolidated_results['errors']:
-                        self.results_display.append(f"❌ {error}")
-                
-                # Process warnings and info to show appropriate emojis
-                if has_warnings:
-                    for warning in filtered_warnings:
-                        # Check if this warning message indicates a successful fix or success
-                        if any(phrase in warning.lower() for phrase in ["created", "fixed", "removed", "cleaned", "parented", "imported", "structure has been fixed", "is now valid"]) or "All validations passed" in warning:
-                            self.results_display.append(f"✅ {warning}")
-                        else:
-                            self.results_display.append(f"⚠️ {warning}")
-                
-                # Show successful fixes with green ticks
-                if has_relevant_info:
-                    for info in filtered_info:
-                        # Check if this info message indicates a successful fix
-                        if any(phrase in info.lower() for phrase in ["created", "fixed", "removed", "cleaned", "parented", "imported"]):
-                            self.results_display.append(f"✅ {info}")
-                        else:
-                            self.results_display.append(f"ℹ️ {info}")
-                
-                # If no errors and no relevant warnings, show success message
-                if not has_errors and not has_warnings:
-                    self.results_display.append("✅ All validations passed successfully!")
-        else:
-            # Show all results - only errors and filtered warnings
-            if has_errors:
-                for error in consolidated_results['errors']:
-                    self.results_display.append(f"❌ {error}")
-            
-            if has_warnings:
-                for warning in filtered_warnings:
-                    # Check if this warning message indicates success
-                    if "All validations passed" in warning:
-                        self.results_display.append(f"✅ {warning}")
-                    else:
-                        self.results_display.append(f"⚠️ {warning}")
-            
-            # If no errors and no relevant warnings, show success message
-            if not has_errors and not has_warnings:
-                self.results_display.append("✅ All validations passed successfully!")
+        return lines
     
+    def _flush_log(self, replace=False):
+        """Write pending result lines to the display in a single update
+        
+        Args:
+            replace (bool): If True, the lines replace the current contents instead of being appended
+        """
+        if replace:
+            self.results_display.setPlainText("\n".join(self._pending_log))
+            self.results_display.moveCursor(QtGui.QTextCursor.End)
+        elif self._pending_log:
+            self.results_display.appendPlainText("\n".join(self._pending_log))
+        self._pending_log.clear()
+
+    def _clear_both(self):
+        """Clear Results button handler"""
+        self.clear_results("both")
 
     def clear_results(self, clear_type="both"):
         """Clear results display"""
@@ -1333,15 +1337,12 @@ class RiggingValidatorUI(QtWidgets.QWidget):
             # Disable the Fix Issues button when results are cleared
             self.btn_fix.setEnabled(False)
             self._did_verify = False
-            # Reset per-module verified state and disable all Fix buttons
-            for module_name in self.module_verified.keys():
+            # Reset per-module verified state and disable the Fix buttons that are still enabled
+            for module_name in self.module_verified:
                 self.module_verified[module_name] = False
-            for module_name, fix_btn in self.module_fix_buttons.items():
-                fix_btn.setEnabled(False)
-        
-        if clear_type in ["both", "info"]:
-            # Clear info list if it exists
-            pass
+                fix_btn = self.module_fix_buttons.get(module_name)
+                if fix_btn is not None and fix_btn.isEnabled():
+                    fix_btn.setEnabled(False)
     
     def update_module_status(self, module_name, status):
         """Update the status button for a specific module
@@ -1352,71 +1353,28 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         """
         if module_name in self.module_status_buttons:
             status_btn = self.module_status_buttons[module_name]
+            if status not in STATUS_GLYPHS:
+                status = 'default'
             
-            if status == 'pass':
-                status_btn.setText("✓")
-                status_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #4CAF50; 
-                        color: #e0e0e0; 
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }
-                    QPushButton:disabled {
-                        background-color: #4CAF50;
-                        color: #e0e0e0;
-                    }
-                """)
-            elif status == 'fail':
-                status_btn.setText("✗")
-                status_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #f44336; 
-                        color: #e0e0e0; 
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }
-                    QPushButton:disabled {
-                        background-color: #f44336;
-                        color: #e0e0e0;
-                    }
-                """)
-            elif status == 'warning':
-                status_btn.setText("?")
-                status_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #ff9800; 
-                        color: #e0e0e0; 
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }
-                    QPushButton:disabled {
-                        background-color: #ff9800;
-                        color: #e0e0e0;
-                    }
-                """)
-            else:  # default
-                status_btn.setText("✓")
-                status_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #505050; 
-                        color: #e0e0e0; 
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }
-                    QPushButton:disabled {
-                        background-color: #505050;
-                        color: #e0e0e0;
-                    }
-                """)
+            # Nothing to do if the button already shows this status
+            previous = self.module_status.get(module_name, 'default')
+            if status == previous:
+                return
+            
+            # Keep the failed-module count in step with the buttons
+            if status == 'fail' and previous != 'fail':
+                self._failed_count += 1
+            elif previous == 'fail' and status != 'fail':
+                self._failed_count -= 1
+            self.module_status[module_name] = status
+            
+            status_btn.setText(STATUS_GLYPHS[status])
+            # Colour comes from the shared row stylesheet via the rigxStatus
+            # property; re-polish so the new selector applies
+            status_btn.setProperty("rigxStatus", status)
+            style = status_btn.style()
+            style.unpolish(status_btn)
+            style.polish(status_btn)
     
     def update_module_status_from_results(self, module_name, results):
         """Update module status based on validation results
@@ -1435,16 +1393,23 @@ class RiggingValidatorUI(QtWidgets.QWidget):
         if total_issues == 0:
             self.update_module_status(module_name, 'pass')
         else:
-            # Check if all issues were fixed
-            fixed_issues = 0
-            if 'issues' in results:
-                for issue in results['issues']:
-                    if issue.get('fixed', False):
-                        fixed_issues += 1
+            # Check if all issues were fixed; stop as soon as both a fixed and an
+            # unfixed issue have been seen. Issues counted but not listed (e.g. an
+            # error result) count as unfixed
+            issues = results.get('issues') or []
+            any_fixed = False
+            any_unfixed = len(issues) < total_issues
+            for issue in issues:
+                if issue.get('fixed', False):
+                    any_fixed = True
+                else:
+                    any_unfixed = True
+                if any_fixed and any_unfixed:
+                    break
             
-            if fixed_issues == total_issues:
+            if not any_unfixed:
                 self.update_module_status(module_name, 'pass')
-            elif fixed_issues > 0:
+            elif any_fixed:
                 # Some issues were fixed, some remain - this is a warning state
                 self.update_module_status(module_name, 'warning')
             else:
@@ -1453,33 +1418,23 @@ class RiggingValidatorUI(QtWidgets.QWidget):
 
     def reset_all_module_statuses(self):
         """Reset all module statuses to default (grey)"""
-        for module_name in self.module_status_buttons:
-            self.update_module_status(module_name, 'default')
-    
-    def _separator(self):
-        """Create a separator line"""
-        separator = QtWidgets.QFrame()
-        separator.setFrameShape(QtWidgets.QFrame.HLine)
-        separator.setFrameShadow(QtWidgets.QFrame.Sunken)
-        separator.setStyleSheet("QFrame { background-color: #2A2A2A ; margin: 10px 0px; }")
-        return separator
+        # Only modules that have moved off default need touching
+        changed = [name for name, status in self.module_status.items() if status != 'default']
+        if not changed:
+            return
+        with self._updates_frozen(self.validations_scroll):
+            for module_name in changed:
+                self.update_module_status(module_name, 'default')
     
     def closeEvent(self, event):
         """Handle window close event"""
+        # Stop any interactive run still scheduled on the event loop
+        self._interactive_cancelled = True
+        
         # Clear the global dialog reference when window is closed
-        try:
-            # Use a safer approach to clear the dialog reference
-            import sys
-            if 'rigging_pipeline.tools.rigx_riggingValidator' in sys.modules:
-                validator_module = sys.modules['rigging_pipeline.tools.rigx_riggingValidator']
-                if hasattr(validator_module, '_dialog') and validator_module._dialog == self:
-                    validator_module._dialog = None
-            
-            # Remove from UIManager if it exists
-            from rigging_pipeline.tools.rigx_riggingValidator import UIManager
-            if "RiggingValidator" in UIManager._open_windows:
-                del UIManager._open_windows["RiggingValidator"]
-        except Exception as e:
-            # If there's any error, just continue
-            pass
+        if self._validator_module._dialog is self:
+            self._validator_module._dialog = None
+        
+        # Remove from UIManager if it exists
+        self._open_windows.pop("RiggingValidator", None)
         event.accept()
@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache, partial
 
 # Maya imports
 try:
@@ -24,7 +25,7 @@ from rigging_pipeline.utils.rig.utils_skinWeights import (
     copy_weights_one_to_many, copy_weights_many_to_one,
     add_influence, remove_influence, bind_skin, unbind_skin,
     remove_unused_influences, curve_to_skin, lattice_to_skin,
-    cluster_to_skin
+    cluster_to_skin, SAFE_NAME_TABLE
 )
 from rigging_pipeline.utils.utils_cleanup import create_clean_mesh_duplicate
 
@@ -34,10 +35,17 @@ ICON_MAP = {
     'open': QtWidgets.QStyle.SP_DialogOpenButton,
     'copy_o2m': QtWidgets.QStyle.SP_ArrowRight,
     'copy_m2o': QtWidgets.QStyle.SP_ArrowLeft,
-    'close': QtWidgets.QStyle.SP_DialogCloseButton
+    'close': QtWidgets.QStyle.SP_DialogCloseButton,
+    'computer': QtWidgets.QStyle.SP_ComputerIcon
 }
 
 
+@lru_cache(maxsize=None)
+def standard_icon(name):
+    """Return the QStyle icon for an ICON_MAP action, built once per session"""
+    return QtWidgets.QApplication.instance().style().standardIcon(ICON_MAP[name])
+
+
 def maya_main_window():
     if not MAYA_AVAILABLE:
         return None
@@ -59,8 +67,6 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         layout.setSpacing(10)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        style = QtWidgets.QApplication.instance().style()
-
         # Add the centralized banner
         banner = Banner("RigX Skin Toolkit", "rigX_icon_skinTools.png")
         layout.addWidget(banner)
@@ -69,21 +75,19 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         # Load/Save Weights group
         group_ws = QtWidgets.QGroupBox("Load/Save Weights")
         ws_layout = QtWidgets.QGridLayout()
-        save_icon = style.standardIcon(ICON_MAP['save'])
-        load_icon = style.standardIcon(ICON_MAP['open'])
+        save_icon = standard_icon('save')
+        load_icon = standard_icon('open')
         # Save buttons
-        self.btn_save_single = QtWidgets.QPushButton(save_icon, "Save Single")
-        self.btn_save_multi  = QtWidgets.QPushButton(save_icon, "Save Multiple")
-        self.btn_save_group  = QtWidgets.QPushButton(save_icon, "Save Group")
+        self.btn_save_single = self._make_button("Save Single", save_icon)
+        self.btn_save_multi  = self._make_button("Save Multiple", save_icon)
+        self.btn_save_group  = self._make_button("Save Group", save_icon)
         for i, btn in enumerate((self.btn_save_single, self.btn_save_multi, self.btn_save_group)):
-            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             ws_layout.addWidget(btn, 0, i)
         # Load buttons
-        self.btn_load_single = QtWidgets.QPushButton(load_icon, "Load Single")
-        self.btn_load_multi  = QtWidgets.QPushButton(load_icon, "Load Multiple")
-        self.btn_load_group  = QtWidgets.QPushButton(load_icon, "Load Group")
+        self.btn_load_single = self._make_button("Load Single", load_icon)
+        self.btn_load_multi  = self._make_button("Load Multiple", load_icon)
+        self.btn_load_group  = self._make_button("Load Group", load_icon)
         for i, btn in enumerate((self.btn_load_single, self.btn_load_multi, self.btn_load_group)):
-            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             ws_layout.addWidget(btn, 1, i)
         group_ws.setLayout(ws_layout)
         layout.addWidget(group_ws)
@@ -91,10 +95,9 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         # Copy Weights group
         group_copy = QtWidgets.QGroupBox("Copy Weights")
         c_layout = QtWidgets.QHBoxLayout()
-        self.btn_copy_o2m = QtWidgets.QPushButton(style.standardIcon(ICON_MAP['copy_o2m']), "One → Many")
-        self.btn_copy_m2o = QtWidgets.QPushButton(style.standardIcon(ICON_MAP['copy_m2o']), "Many → One")
+        self.btn_copy_o2m = self._make_button("One → Many", standard_icon('copy_o2m'))
+        self.btn_copy_m2o = self._make_button("Many → One", standard_icon('copy_m2o'))
         for btn in (self.btn_copy_o2m, self.btn_copy_m2o):
-            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             c_layout.addWidget(btn)
         group_copy.setLayout(c_layout)
         layout.addWidget(group_copy)
@@ -105,27 +108,24 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         
         # Create box layout for influence buttons
         inf_box = QtWidgets.QHBoxLayout()
-        self.btn_add_inf = QtWidgets.QPushButton("Add Influence")
-        self.btn_rem_inf = QtWidgets.QPushButton("Remove Influence")
+        self.btn_add_inf = self._make_button("Add Influence")
+        self.btn_rem_inf = self._make_button("Remove Influence")
         for btn in (self.btn_add_inf, self.btn_rem_inf):
-            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             inf_box.addWidget(btn)
         u_layout.addLayout(inf_box)
         
         # Create box layout for bind/unbind buttons
         bind_box = QtWidgets.QHBoxLayout()
-        self.btn_bind = QtWidgets.QPushButton("Bind Skin")
-        self.btn_unbind = QtWidgets.QPushButton("Unbind Skin")
+        self.btn_bind = self._make_button("Bind Skin")
+        self.btn_unbind = self._make_button("Unbind Skin")
         for btn in (self.btn_bind, self.btn_unbind):
-            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             bind_box.addWidget(btn)
         u_layout.addLayout(bind_box)
         
         # Add remaining buttons
-        self.btn_rm_unused = QtWidgets.QPushButton("Remove Unused Influences")
-        self.btn_clean_dup = QtWidgets.QPushButton("Clean Duplicate")
+        self.btn_rm_unused = self._make_button("Remove Unused Influences")
+        self.btn_clean_dup = self._make_button("Clean Duplicate")
         for btn in (self.btn_rm_unused, self.btn_clean_dup):
-            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             u_layout.addWidget(btn)
             
         group_utils.setLayout(u_layout)
@@ -134,11 +134,10 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         # Convert Skin group
         group_conv = QtWidgets.QGroupBox("Convert Skin")
         cv_layout = QtWidgets.QVBoxLayout()
-        self.btn_curve2s   = QtWidgets.QPushButton("Curve to Skin")
-        self.btn_lattice2s = QtWidgets.QPushButton("Lattice to Skin")
-        self.btn_cluster2s = QtWidgets.QPushButton("Cluster to Skin")
+        self.btn_curve2s   = self._make_button("Curve to Skin")
+        self.btn_lattice2s = self._make_button("Lattice to Skin")
+        self.btn_cluster2s = self._make_button("Cluster to Skin")
         for btn in (self.btn_curve2s, self.btn_lattice2s, self.btn_cluster2s):
-            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             cv_layout.addWidget(btn)
         group_conv.setLayout(cv_layout)
         layout.addWidget(group_conv)
@@ -146,8 +145,7 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         # Rebind Skin group
         group_rebind = QtWidgets.QGroupBox("Rebind Skin")
         rebind_layout = QtWidgets.QVBoxLayout()
-        self.btn_rebind = QtWidgets.QPushButton("Rebind Skin")
-        self.btn_rebind.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        self.btn_rebind = self._make_button("Rebind Skin")
         rebind_layout.addWidget(self.btn_rebind)
         group_rebind.setLayout(rebind_layout)
         layout.addWidget(group_rebind)
@@ -162,13 +160,12 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         
         if os.path.exists(ngskin_icon_path):
             ngskin_icon = QtGui.QIcon(ngskin_icon_path)
-            self.btn_ngskin = QtWidgets.QPushButton(ngskin_icon, "ngSkinTools 2")
+            self.btn_ngskin = self._make_button("ngSkinTools 2", ngskin_icon)
         else:
             # Fallback to standard icon if custom icon not found
-            self.btn_ngskin = QtWidgets.QPushButton(style.standardIcon(QtWidgets.QStyle.SP_ComputerIcon), "Open ngSkinTools 2")
+            self.btn_ngskin = self._make_button("Open ngSkinTools 2", standard_icon('computer'))
             print(f"Warning: ngSkinTools2 icon not found at {ngskin_icon_path}")
         
-        self.btn_ngskin.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         ngskin_layout.addWidget(self.btn_ngskin)
         group_ngskin.setLayout(ngskin_layout)
         layout.addWidget(group_ngskin)
@@ -176,9 +173,7 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         # Separator and close
         sep = QtWidgets.QFrame(); sep.setFrameShape(QtWidgets.QFrame.HLine); sep.setFrameShadow(QtWidgets.QFrame.Sunken)
         layout.addWidget(sep)
-        self.btn_close = QtWidgets.QPushButton("Close")
-        self.btn_close.setIcon(style.standardIcon(ICON_MAP['close']))
-        self.btn_close.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        self.btn_close = self._make_button("Close", standard_icon('close'))
         self.btn_close.clicked.connect(self.close)
         layout.addWidget(self.btn_close)
 
@@ -191,18 +186,24 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         self.btn_load_group.clicked.connect(self._on_load_group)
         self.btn_copy_o2m.clicked.connect(self._on_copy_o2m)
         self.btn_copy_m2o.clicked.connect(self._on_copy_m2o)
-        self.btn_add_inf.clicked.connect(lambda: add_influence(cmds.ls(selection=True)[0], cmds.ls(selection=True)[1]))
-        self.btn_rem_inf.clicked.connect(lambda: remove_influence(cmds.ls(selection=True)[0], cmds.ls(selection=True)[1]))
+        self.btn_add_inf.clicked.connect(partial(self._run_on_pair, add_influence, "joint"))
+        self.btn_rem_inf.clicked.connect(partial(self._run_on_pair, remove_influence, "joint"))
         self.btn_bind.clicked.connect(lambda: bind_skin(cmds.ls(selection=True)))
         self.btn_unbind.clicked.connect(lambda: unbind_skin(cmds.ls(selection=True)[0]))
         self.btn_rm_unused.clicked.connect(lambda: remove_unused_influences(cmds.ls(selection=True)[0]))
         self.btn_clean_dup.clicked.connect(lambda: create_clean_mesh_duplicate())
-        self.btn_curve2s.clicked.connect(lambda: curve_to_skin(cmds.ls(selection=True)[0], cmds.ls(selection=True)[1]))
-        self.btn_lattice2s.clicked.connect(lambda: lattice_to_skin(cmds.ls(selection=True)[0], cmds.ls(selection=True)[1]))
-        self.btn_cluster2s.clicked.connect(lambda: cluster_to_skin(cmds.ls(selection=True)[0], cmds.ls(selection=True)[1]))
+        self.btn_curve2s.clicked.connect(partial(self._run_on_pair, curve_to_skin, "curve"))
+        self.btn_lattice2s.clicked.connect(partial(self._run_on_pair, lattice_to_skin, "lattice"))
+        self.btn_cluster2s.clicked.connect(partial(self._run_on_pair, cluster_to_skin, "cluster"))
         self.btn_rebind.clicked.connect(self._on_rebind_skin)
         self.btn_ngskin.clicked.connect(self._on_ngskin)
 
+    def _make_button(self, label, icon=None):
+        """Create a push button that stretches across its row"""
+        btn = QtWidgets.QPushButton(label) if icon is None else QtWidgets.QPushButton(icon, label)
+        btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        return btn
+
     # Save Handlers
     def _on_save_single(self):
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save Weights - Single", "", "JSON Files (*.json)")
@@ -248,30 +249,28 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         if folder:
             meshes = cmds.ls(selection=True, transforms=True)
             if meshes:
-                # Get all JSON files in the folder
-                json_files = [f for f in os.listdir(folder) if f.endswith('.json')]
+                # Get all JSON files in the folder; a set so each mesh is matched in O(1)
+                json_files = {f for f in os.listdir(folder) if f.endswith('.json')}
                 if not json_files:
                     cmds.warning(f"No weight files found in {folder}")
                     return
                 
-                # Create a mapping of mesh names to their weight files
-                mesh_to_file = {}
+                # Load weights for each mesh that has a matching file
+                matched_count = 0
+                loaded_count = 0
                 for mesh in meshes:
-                    safe_name = mesh.replace('|', '_').replace('/', '_').replace('\\', '_')
+                    safe_name = mesh.translate(SAFE_NAME_TABLE)
                     weight_file = f"{safe_name}.json"
-                    if weight_file in json_files:
-                        mesh_to_file[mesh] = os.path.join(folder, weight_file)
+                    if weight_file not in json_files:
+                        continue
+                    matched_count += 1
+                    if load_weights_from_file(mesh, os.path.join(folder, weight_file)):
+                        loaded_count += 1
                 
-                if not mesh_to_file:
+                if not matched_count:
                     cmds.warning("No matching weight files found for selected meshes.")
                     return
                 
-                # Load weights for each mesh that has a matching file
-                loaded_count = 0
-                for mesh, weight_file in mesh_to_file.items():
-                    if load_weights_from_file(mesh, weight_file):
-                        loaded_count += 1
-                
                 if loaded_count:
                     cmds.inViewMessage(statusMessage=f"Loaded weights for {loaded_count} meshes.", fade=True)
                 else:
@@ -302,6 +301,15 @@ class SkinWeightsToolUI(QtWidgets.QDialog):
         else:
             copy_weights_many_to_one(sels[:-1], sels[-1])
 
+    # Influence and Convert Handlers
+    def _run_on_pair(self, fn, what):
+        """Call fn with the first two selected objects: the given source type, then the mesh"""
+        sels = cmds.ls(selection=True)
+        if len(sels) < 2:
+            cmds.warning(f"Select {what} then mesh.")
+        else:
+            fn(sels[0], sels[1])
+
     # Rebind Handler
     def _on_rebind_skin(self):
         """Rebind skin for selected objects"""
@@ -37,6 +37,62 @@ ICON_MAP = {
 }
 
 
+# Rename tool button styling, applied once on the Rename tab and picked up by
+# every button tagged with the "rename" rigxRole property
+RENAME_BUTTON_STYLESHEET = """
+    QPushButton[rigxRole="rename"] {
+        background-color: #2D2D2D;
+        border: 1px solid rgba(255, 255, 255, 0.3);
+        border-radius: 4px;
+        color: #e2e8f0;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QPushButton[rigxRole="rename"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(255,255,255,0.1), stop:1 rgba(255,255,255,0.05));
+        border-color: rgba(255, 255, 255, 0.5);
+    }
+    QPushButton[rigxRole="rename"]:pressed {
+        background-color: #e0e0e0;
+        color: #2D2D2D;
+    }
+"""
+
+
+# Additional Controllers dialog buttons (Maya default font, white text with hover
+# effects), applied once on the dialog's group and picked up by the "controller" rigxRole
+CONTROLLER_BUTTON_STYLESHEET = """
+    QPushButton[rigxRole="controller"] {
+        background-color: rgba(74, 85, 104, 0.8);
+        border: 1px solid #666666;
+        border-radius: 4px;
+        padding: 6px;
+        color: white;
+        font-weight: bold;
+    }
+    QPushButton[rigxRole="controller"]:hover {
+        background-color: rgba(255, 255, 255, 0.9);
+        border-color: #ffffff;
+        color: #2D2D2D;
+    }
+    QPushButton[rigxRole="controller"]:pressed {
+        background-color: rgba(224, 224, 224, 0.9);
+        border-color: #ffffff;
+    }
+"""
+
+
+# Quick tool button label -> RigXUtilityTools method that runs it
+QUICK_TOOL_METHODS = {
+    "Offset Groups": "run_offset_group_tool",
+    "Joint @ Center": "run_joint_at_center_tool",
+    "Curve to Joint": "run_curve_to_joint_tool",
+    "Inbetween Joints": "run_inbetween_joints_tool",
+    "Rotation to Orient": "run_rotation_to_orient_tool",
+    "Orient to Rotation": "run_orient_to_rotation_tool",
+    "Re-Skin": "run_reskin_tool",
+}
+
 
 def _maya_index_to_hex(color_index: int) -> str:
     """Return hex color approximating Maya viewport wire color for an index.
@@ -93,6 +149,13 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         self.resize(450, 700)  # Slightly smaller for better performance
         self.tool_instance = None
         
+        # Single-shot timer so dragging the radius slider applies the radius once
+        # it settles, instead of re-querying and setting every joint per tick
+        self._radius_timer = QtCore.QTimer(self)
+        self._radius_timer.setSingleShot(True)
+        self._radius_timer.setInterval(50)
+        self._radius_timer.timeout.connect(self.apply_joint_radius)
+        
         # Create central widget for QMainWindow
         central_widget = QtWidgets.QWidget()
         self.setCentralWidget(central_widget)
@@ -782,6 +845,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         
         # ==================== RENAME TAB ====================
         rename_tab = QtWidgets.QWidget()
+        rename_tab.setStyleSheet(RENAME_BUTTON_STYLESHEET)
         rename_layout = QtWidgets.QVBoxLayout(rename_tab)
         rename_layout.setSpacing(8)
         rename_layout.setContentsMargins(8, 8, 8, 8)
@@ -993,7 +1057,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         prefix_btn.setMinimumWidth(60)
         # Add tooltip description
         self._add_tooltip(prefix_btn, "Add Prefix")
-        prefix_btn.setStyleSheet(self._get_button_style())
+        prefix_btn.setProperty("rigxRole", "rename")
         prefix_btn.clicked.connect(partial(self.run_rename_tool, "prefix_ui"))
         prefix_row.addWidget(prefix_btn)
         prefix_suffix_layout.addLayout(prefix_row)
@@ -1021,7 +1085,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         suffix_btn.setMinimumWidth(60)
         # Add tooltip description
         self._add_tooltip(suffix_btn, "Add Suffix")
-        suffix_btn.setStyleSheet(self._get_button_style())
+        suffix_btn.setProperty("rigxRole", "rename")
         suffix_btn.clicked.connect(partial(self.run_rename_tool, "suffix_ui"))
         suffix_row.addWidget(suffix_btn)
         prefix_suffix_layout.addLayout(suffix_row)
@@ -1156,7 +1220,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         for i, (text, action) in enumerate(utility_tools):
             btn = QtWidgets.QPushButton(text)
             btn.setMinimumHeight(28)
-            btn.setStyleSheet(self._get_button_style())
+            btn.setProperty("rigxRole", "rename")
             btn.clicked.connect(partial(self.run_rename_tool, action))
             utilities_layout.addWidget(btn, i // 2, i % 2)
         
@@ -1442,7 +1506,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         self.radius_spinbox.blockSignals(True)
         self.radius_spinbox.setValue(float_value)
         self.radius_spinbox.blockSignals(False)
-        self.apply_joint_radius()
+        self._radius_timer.start()
 
     def _on_spinbox_changed(self, value):
         """Handle spinbox value change - convert to int and update slider"""
@@ -1450,7 +1514,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         self.radius_slider.blockSignals(True)
         self.radius_slider.setValue(int_value)
         self.radius_slider.blockSignals(False)
-        self.apply_joint_radius()
+        self._radius_timer.start()
 
     def apply_joint_radius(self):
         """Apply radius to selected joints or all joints if none selected"""
@@ -1492,35 +1556,27 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         except Exception as e:
             cmds.warning(f"Error applying joint radius: {str(e)}")
 
-    def run_quick_tool(self, tool_name):
-        """Run quick tools based on name"""
+    def _tools(self):
+        """Return the shared RigXUtilityTools backend, created on first use"""
         if not self.tool_instance:
+            # The backend module imports this one at load time, so it is imported here
             from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
             self.tool_instance = RigXUtilityTools()
-        
-        if tool_name == "Offset Groups":
-            self.tool_instance.run_offset_group_tool()
-        elif tool_name == "Joint @ Center":
-            self.tool_instance.run_joint_at_center_tool()
-        elif tool_name == "Curve to Joint":
-            self.tool_instance.run_curve_to_joint_tool()
-        elif tool_name == "Joint to Curve":
+        return self.tool_instance
+
+    def run_quick_tool(self, tool_name):
+        """Run quick tools based on name"""
+        if tool_name == "Joint to Curve":
+            # Needs options first, so it opens a dialog instead of running directly
             self.show_joint_to_curve_dialog()
-        elif tool_name == "Inbetween Joints":
-            self.tool_instance.run_inbetween_joints_tool()
-        elif tool_name == "Rotation to Orient":
-            self.tool_instance.run_rotation_to_orient_tool()
-        elif tool_name == "Orient to Rotation":
-            self.tool_instance.run_orient_to_rotation_tool()
-        elif tool_name == "Re-Skin":
-            self.tool_instance.run_reskin_tool()
+            return
+        
+        method_name = QUICK_TOOL_METHODS.get(tool_name)
+        if method_name:
+            getattr(self._tools(), method_name)()
 
     def show_controller_dialog(self):
          """Show dialog for additional controller types"""
-         if not self.tool_instance:
-             from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-             self.tool_instance = RigXUtilityTools()
-         
          # Create dialog matching main UI style
          dialog = QtWidgets.QDialog(self)
          dialog.setWindowTitle("Additional Controllers")
@@ -1573,6 +1629,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
          
          # Controller group box
          group_controllers = QtWidgets.QGroupBox("Controller Types")
+         group_controllers.setStyleSheet(CONTROLLER_BUTTON_STYLESHEET)
          controllers_layout = QtWidgets.QGridLayout()
          controllers_layout.setSpacing(6)
          
@@ -1607,27 +1664,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
                  btn = QtWidgets.QPushButton(ctrl_type)
              btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
              btn.setMinimumHeight(30)
-             # Use Maya default font and white color with hover effects
-             btn.setStyleSheet("""
-                 QPushButton {
-                     background-color: rgba(74, 85, 104, 0.8);
-                     border: 1px solid #666666;
-                     border-radius: 4px;
-                     padding: 6px;
-                     color: white;
-                     font-weight: bold;
-                 }
-                 QPushButton:hover {
-                     background-color: rgba(255, 255, 255, 0.9);
-                     border-color: #ffffff;
-                     color: #2D2D2D;
-                 }
-                 QPushButton:pressed {
-                     background-color: rgba(224, 224, 224, 0.9);
-                     border-color: #ffffff;
-                 }
-             """)
-             from functools import partial
+             btn.setProperty("rigxRole", "controller")
              btn.clicked.connect(partial(self.run_create_controller_tool, ctrl_type))
              controllers_layout.addWidget(btn, i // 3, i % 3)
          
@@ -1683,9 +1720,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
 
     def show_joint_to_curve_dialog(self):
         """Dialog to configure Joint to Curve options and execute the tool."""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
+        tools = self._tools()
         
         dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle("Joint to Curve")
@@ -1757,7 +1792,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
             # Curve type
             curve_type = type_cb.currentText()
             try:
-                self.tool_instance.run_joint_to_curve_tool(joints=joints, degree=degree, curve_type=curve_type)
+                tools.run_joint_to_curve_tool(joints=joints, degree=degree, curve_type=curve_type)
             except Exception as exc:
                 QtWidgets.QMessageBox.critical(dialog, "Joint to Curve", f"Error: {exc}")
                 return
@@ -1778,31 +1813,19 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
 
     def run_create_controller_tool(self, controller_type):
         """Run controller creation tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_create_controller_tool(controller_type)
+        self._tools().run_create_controller_tool(controller_type)
 
     def run_override_color_tool(self, color_index):
         """Run color override tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_override_color_tool(color_index)
+        self._tools().run_override_color_tool(color_index)
 
     def run_orient_joint_tool(self, orientation_type):
         """Run joint orientation tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_orient_joint_tool(orientation_type)
+        self._tools().run_orient_joint_tool(orientation_type)
 
     def run_add_attribute_tool(self, attr_type):
         """Run add attribute tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_add_attribute_tool(attr_type)
+        self._tools().run_add_attribute_tool(attr_type)
 
     # ===== Attribute Manager handlers =====
     def refresh_attribute_list(self):
@@ -1865,10 +1888,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
                 if not name:
                     QtWidgets.QMessageBox.warning(self, "Add Attribute", "Please enter an attribute name")
                     return
-                if not self.tool_instance:
-                    from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-                    self.tool_instance = RigXUtilityTools()
-                self.tool_instance.attribute_manager("add", [name], {"type": attr_type, "enum": enum_def, "min": min_val, "max": max_val})
+                self._tools().attribute_manager("add", [name], {"type": attr_type, "enum": enum_def, "min": min_val, "max": max_val})
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Add Attribute", f"Error: {e}")
 
@@ -1878,10 +1898,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
             if not names:
                 QtWidgets.QMessageBox.information(self, "Remove Attribute", "Select attribute(s) in the Channel Box")
                 return
-            if not self.tool_instance:
-                from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-                self.tool_instance = RigXUtilityTools()
-            self.tool_instance.attribute_manager("remove", names)
+            self._tools().attribute_manager("remove", names)
             self.refresh_attribute_list()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Remove Attribute", f"Error: {e}")
@@ -1892,10 +1909,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
             if not names and action in ["lock", "unlock", "hide", "unhide"]:
                 QtWidgets.QMessageBox.information(self, action.title(), "Select attribute(s) in the Channel Box")
                 return
-            if not self.tool_instance:
-                from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-                self.tool_instance = RigXUtilityTools()
-            self.tool_instance.attribute_manager(action, names)
+            self._tools().attribute_manager(action, names)
             self.refresh_attribute_list()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, action.title(), f"Error: {e}")
@@ -1908,13 +1922,11 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
             if not sel:
                 QtWidgets.QMessageBox.information(self, "Unhide Attributes", "Select one or more objects in the Outliner")
                 return
-            if not self.tool_instance:
-                from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-                self.tool_instance = RigXUtilityTools()
+            tools = self._tools()
             # Gather hidden attributes across all selected; use intersection to show only common ones
             hidden_sets = []
             for obj in sel:
-                hidden_sets.append(set(self.tool_instance.list_hidden_attributes(obj)))
+                hidden_sets.append(set(tools.list_hidden_attributes(obj)))
             hidden_common = sorted(list(set.intersection(*hidden_sets))) if hidden_sets else []
             if not hidden_common:
                 QtWidgets.QMessageBox.information(self, "Unhide Attributes", "No hidden user-defined attributes found on all selected objects")
@@ -1937,7 +1949,7 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
                 if not names:
                     return
                 # Apply unhide across all selected objects
-                self.tool_instance.attribute_manager("unhide", names)
+                tools.attribute_manager("unhide", names)
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Unhide Attributes", f"Error: {e}")
 
@@ -1952,13 +1964,10 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
             if len(sel) != 2:
                 QtWidgets.QMessageBox.information(self, "Transfer Attribute", "Select exactly two objects (TARGET first, then SOURCE)")
                 return
-            if not self.tool_instance:
-                from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-                self.tool_instance = RigXUtilityTools()
             # User flow: target first, then source
             target_obj = sel[0]
             source_obj = sel[1]
-            self.tool_instance.attribute_manager("transfer", names, {"source": source_obj, "target": target_obj})
+            self._tools().attribute_manager("transfer", names, {"source": source_obj, "target": target_obj})
             self.refresh_attribute_list()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Transfer Attribute", f"Error: {e}")
@@ -1966,31 +1975,19 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
 
     def run_lock_hide_attributes_tool(self, action_type):
         """Run lock/hide attributes tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_lock_hide_attributes_tool(action_type)
+        self._tools().run_lock_hide_attributes_tool(action_type)
 
     def run_copy_weights_tool(self, copy_type):
         """Run copy weights tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_copy_weights_tool(copy_type)
+        self._tools().run_copy_weights_tool(copy_type)
 
     def run_create_sets_tool(self, set_type):
         """Run create sets tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_create_sets_tool(set_type)
+        self._tools().run_create_sets_tool(set_type)
 
     def run_add_to_sets_tool(self, set_type):
         """Run add to sets tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_add_to_sets_tool(set_type)
+        self._tools().run_add_to_sets_tool(set_type)
 
     # ===== Sets minimal MEL-backed actions =====
     def run_sets_create(self):
@@ -2055,13 +2052,9 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.warning(self, "Rivet Tool", "Maya is not available.")
                 return
             
-            if not self.tool_instance:
-                from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-                self.tool_instance = RigXUtilityTools()
-            
             # Get checkbox state
             create_joint = self.checkbox_rivet_joint.isChecked()
-            self.tool_instance.run_rivet_tool(create_joint=create_joint)
+            self._tools().run_rivet_tool(create_joint=create_joint)
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Rivet Tool", f"Error: {e}")
 
@@ -2072,20 +2065,12 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.warning(self, "Follicle Tool", "Maya is not available.")
                 return
             
-            if not self.tool_instance:
-                from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-                self.tool_instance = RigXUtilityTools()
-            
-            self.tool_instance.run_follicle_tool()
+            self._tools().run_follicle_tool()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Follicle Tool", f"Error: {e}")
 
     def run_rename_tool(self, action):
         """Run rename tool based on action"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        
         # Pass UI field values for the UI-based actions
         ui_data = {}
         if hasattr(self, 'search_field'):
@@ -2118,21 +2103,15 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         if action == "clear_fields":
             self._clear_rename_fields()
         else:
-            self.tool_instance.run_rename_tool(action, ui_data)
+            self._tools().run_rename_tool(action, ui_data)
 
     def run_joint_tool(self, action):
         """Run joint tool based on action"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_joint_tool(action)
+        self._tools().run_joint_tool(action)
 
     def run_unhide_joints_tool(self):
         """Run unhide joints tool"""
-        if not self.tool_instance:
-            from rigging_pipeline.tools.rigx_utilityTools import RigXUtilityTools
-            self.tool_instance = RigXUtilityTools()
-        self.tool_instance.run_joint_tool("unhide_joints")
+        self._tools().run_joint_tool("unhide_joints")
 
     def _clear_rename_fields(self):
         """Clear all rename input fields"""
@@ -2155,27 +2134,6 @@ class RigXUtilityToolsUI(QtWidgets.QMainWindow):
         except Exception as e:
             print(f"Error clearing fields: {str(e)}")
 
-    def _get_button_style(self):
-        """Get consistent button styling for rename tools"""
-        return """
-            QPushButton {
-                background-color: #2D2D2D;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                border-radius: 4px;
-                color: #e2e8f0;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(255,255,255,0.1), stop:1 rgba(255,255,255,0.05));
-                border-color: rgba(255, 255, 255, 0.5);
-            }
-            QPushButton:pressed {
-                background-color: #e0e0e0;
-                color: #2D2D2D;
-            }
-        """
-
     def closeEvent(self, event):
         """Handle window close event - clean up resources"""
         # Clean up any resources if needed
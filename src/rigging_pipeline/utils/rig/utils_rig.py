@@ -1,6 +1,20 @@
 import os
+from contextlib import contextmanager
 import maya.cmds as cmds
 
+
+@contextmanager
+def suspend_viewport_refresh():
+    """Suspend viewport redraws for the duration of the block, restoring the previous state on exit"""
+    was_suspended = cmds.refresh(query=True, suspend=True)
+    if not was_suspended:
+        cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        if not was_suspended:
+            cmds.refresh(suspend=False)
+
 def select_object(field_name):
     """Generic function to handle object selection"""
     sel = cmds.ls(selection=True)
@@ -4,6 +4,9 @@ import maya.api.OpenMayaAnim as oma
 import json, os
 from maya import OpenMayaUI as omui
 
+# Path separators that can't appear in a weight file name
+SAFE_NAME_TABLE = str.maketrans({'|': '_', '/': '_', '\\': '_'})
+
 
 def _get_skin_cluster(mesh):
     """Find skinCluster on a mesh, return None if not found."""
@@ -16,8 +19,7 @@ def _get_skin_cluster(mesh):
 def _get_safe_filename(mesh_name):
     """Convert mesh name to a safe filename by replacing invalid characters."""
     # Remove any path separators and invalid characters
-    safe_name = mesh_name.replace('|', '_').replace('/', '_').replace('\\', '_')
-    return safe_name
+    return mesh_name.translate(SAFE_NAME_TABLE)
 
 def _get_folder_name(filepath):
     """Extract folder name from filepath, removing any extension."""